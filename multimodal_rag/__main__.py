@@ -3,8 +3,15 @@ import signal
 import sys
 from typing import Optional
 
+try:
+    # Optional faster event loop; not available on Windows
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from multimodal_rag.frameworks.logging_config import get_logger
 from multimodal_rag.container import ApplicationContainer
+from multimodal_rag.frameworks.google_genai_base_service import close_shared_clients
 
 logger = get_logger(__name__)
 
@@ -84,6 +91,8 @@ class TelegramBotRunner:
                 logger.info("Shutting down container resources...")
                 await self.container.shutdown_resources()
 
+            await close_shared_clients()
+
             logger.info("Shutdown completed successfully")
 
         except Exception as e:
@@ -110,6 +119,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -1,13 +1,16 @@
 """Elasticsearch adaptor for document indexing and search."""
 
+import copy
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
 
+import numpy as np
 from elasticsearch import AsyncElasticsearch
 from elasticsearch.exceptions import NotFoundError
 from elasticsearch.helpers import async_bulk
 
 from ...usecases.interfaces.document_repository import IDocumentIndexRepository
+from .elasticsearch_config import INDEX_MAPPING
 
 from ...entities.document import (
     DoclingDocument,
@@ -25,128 +28,14 @@ class ElasticsearchDocumentAdaptor(IDocumentIndexRepository):
 
     DEFAULT_INDEX = "multimodal_index"
 
-    MAPPING = {
-        "mappings": {
-            "properties": {
-                "document": {
-                    "properties": {
-                        "schema_name": {"type": "keyword"},
-                        "version": {"type": "keyword"},
-                        "name": {"type": "text", "analyzer": "standard"},
-                        "origin": {
-                            "properties": {
-                                "mimetype": {"type": "keyword"},
-                                "binary_hash": {"type": "long"},
-                                "filename": {"type": "text", "analyzer": "standard"},
-                            }
-                        },
-                        "furniture": {"type": "object", "enabled": False},
-                        "body": {"type": "object", "enabled": False},
-                        "groups": {"type": "object", "enabled": False},
-                        "texts": {"type": "object", "enabled": False},
-                        "pictures": {"type": "object", "enabled": False},
-                        "tables": {"type": "object", "enabled": False},
-                        "key_value_items": {"type": "object", "enabled": False},
-                        "form_items": {"type": "object", "enabled": False},
-                        "pages": {"type": "object", "enabled": False},
-                    }
-                },
-                "chunk": {
-                    "properties": {
-                        "text": {
-                            "type": "text",
-                            "analyzer": "standard",
-                            "fields": {
-                                "keyword": {"type": "keyword", "ignore_above": 256}
-                            },
-                        },
-                        "meta": {
-                            "properties": {
-                                "schema_name": {"type": "keyword"},
-                                "version": {"type": "keyword"},
-                                "headings": {"type": "text", "analyzer": "standard"},
-                                "origin": {
-                                    "properties": {
-                                        "mimetype": {"type": "keyword"},
-                                        "binary_hash": {"type": "long"},
-                                        "filename": {
-                                            "type": "text",
-                                            "analyzer": "standard",
-                                        },
-                                    }
-                                },
-                                "doc_items": {"type": "object", "enabled": False},
-                            }
-                        },
-                        "vector": {
-                            "type": "dense_vector",
-                            "dims": 768,  # Default for OpenAI embeddings, adjust as needed
-                            "index": True,
-                            "similarity": "cosine",
-                        },
-                        "document_id": {
-                            "type": "keyword"
-                        },  # Reference to parent document
-                    }
-                },
-                "text": {
-                    "properties": {
-                        "text_id": {"type": "keyword"},
-                        "document_id": {"type": "keyword"},
-                        "text": {
-                            "type": "text",
-                            "analyzer": "standard",
-                            "fields": {
-                                "keyword": {"type": "keyword", "ignore_above": 256}
-                            },
-                        },
-                        "label": {"type": "keyword"},
-                        "level": {"type": "integer"},
-                        "orig": {"type": "text", "analyzer": "standard"},
-                        "parent_ref": {"type": "keyword"},
-                        "children_refs": {"type": "keyword"},
-                        "prov": {"type": "object", "enabled": False},
-                    }
-                },
-                "picture": {
-                    "properties": {
-                        "picture_id": {"type": "keyword"},
-                        "document_id": {"type": "keyword"},
-                        "label": {"type": "keyword"},
-                        "captions": {"type": "text", "analyzer": "standard"},
-                        "references": {"type": "keyword"},
-                        "footnotes": {"type": "keyword"},
-                        "parent_ref": {"type": "keyword"},
-                        "children_refs": {"type": "keyword"},
-                        "prov": {"type": "object", "enabled": False},
-                        "image": {"type": "object", "enabled": False},
-                        "annotations": {"type": "object", "enabled": False},
-                    }
-                },
-                "table": {
-                    "properties": {
-                        "table_id": {"type": "keyword"},
-                        "document_id": {"type": "keyword"},
-                        "label": {"type": "keyword"},
-                        "captions": {"type": "text", "analyzer": "standard"},
-                        "references": {"type": "keyword"},
-                        "footnotes": {"type": "keyword"},
-                        "parent_ref": {"type": "keyword"},
-                        "children_refs": {"type": "keyword"},
-                        "prov": {"type": "object", "enabled": False},
-                        "data": {"type": "object", "enabled": False},
-                        "annotations": {"type": "object", "enabled": False},
-                    }
-                },
-            }
-        }
-    }
+    MAPPING = INDEX_MAPPING
 
     def __init__(
         self,
         elasticsearch_client: AsyncElasticsearch,
         index_name: str = DEFAULT_INDEX,
         vector_dimensions: int = 768,
+        index_mapping: Optional[Dict[str, Any]] = None,
     ):
         """Initialize the Elasticsearch adaptor.
 
@@ -154,21 +43,25 @@ class ElasticsearchDocumentAdaptor(IDocumentIndexRepository):
             elasticsearch_client: AsyncElasticsearch client instance
             index_name: Name of the index for documents and chunks
             vector_dimensions: Dimension of the vector embeddings
+            index_mapping: Prebuilt index mapping (e.g. ElasticsearchConfig.index_mapping)
         """
         self._es = elasticsearch_client
         self._index_name = index_name
         self._vector_dimensions = vector_dimensions
 
-        # Update mapping with correct vector dimensions
-        self.MAPPING["mappings"]["properties"]["chunk"]["properties"]["vector"][
-            "dims"
-        ] = vector_dimensions
+        if index_mapping is None:
+            # Build a private copy so instances never mutate the shared template
+            index_mapping = copy.deepcopy(self.MAPPING)
+            index_mapping["mappings"]["properties"]["chunk"]["properties"]["vector"][
+                "dims"
+            ] = vector_dimensions
+        self._index_mapping = index_mapping
 
     async def initialize_indices(self) -> bool:
         """Initialize the Elasticsearch index with proper mapping."""
         try:
             if not await self._es.indices.exists(index=self._index_name):
-                await self._es.indices.create(index=self._index_name, body=self.MAPPING)
+                await self._es.indices.create(index=self._index_name, body=self._index_mapping)
                 logger.info(f"Created index: {self._index_name}")
 
             return True
@@ -583,7 +476,7 @@ class ElasticsearchDocumentAdaptor(IDocumentIndexRepository):
     async def search_chunks(
         self,
         query: Optional[str] = None,
-        vector: Optional[List[float]] = None,
+        vector: Optional[Union[List[float], np.ndarray]] = None,
         filters: Optional[Dict[str, Any]] = None,
         size: int = 10,
         index_name: Optional[str] = None,
@@ -607,7 +500,7 @@ class ElasticsearchDocumentAdaptor(IDocumentIndexRepository):
             }
 
             # Add vector search if provided
-            if vector and "knn" in query_dict:
+            if "knn" in query_dict:
                 search_params["knn"] = query_dict["knn"]
 
             result = await self._es.search(**search_params)
@@ -737,12 +630,14 @@ class ElasticsearchDocumentAdaptor(IDocumentIndexRepository):
     def _build_chunk_search_query(
         self,
         query: Optional[str] = None,
-        vector: Optional[List[float]] = None,
+        vector: Optional[Union[List[float], np.ndarray]] = None,
         filters: Optional[Dict[str, Any]] = None,
         size: int = 10,
     ) -> Dict[str, Any]:
         """Build search query for chunks."""
         query_parts = {}
+        # Embeddings may be NumPy arrays, which have no truth value
+        has_vector = vector is not None and len(vector) > 0
 
         # Text search with field existence filter for chunks
         if query:
@@ -770,7 +665,7 @@ class ElasticsearchDocumentAdaptor(IDocumentIndexRepository):
             query_parts["query"] = text_query
 
         # Vector search
-        if vector:
+        if has_vector:
             knn_query = {
                 "field": "chunk.vector",
                 "query_vector": vector,
@@ -791,7 +686,7 @@ class ElasticsearchDocumentAdaptor(IDocumentIndexRepository):
             query_parts["knn"] = knn_query
 
         # If both text and vector, create hybrid search
-        if query and vector:
+        if query and has_vector:
             # For hybrid search, we use the KNN with a filter that includes the text match
             hybrid_filter = {
                 "bool": {
@@ -1,8 +1,130 @@
 """Configuration for Elasticsearch adaptor."""
 
+import copy
+from functools import cached_property
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any
 
+INDEX_MAPPING: Dict[str, Any] = {
+    "mappings": {
+        "properties": {
+            "document": {
+                "properties": {
+                    "schema_name": {"type": "keyword"},
+                    "version": {"type": "keyword"},
+                    "name": {"type": "text", "analyzer": "standard"},
+                    "origin": {
+                        "properties": {
+                            "mimetype": {"type": "keyword"},
+                            "binary_hash": {"type": "long"},
+                            "filename": {"type": "text", "analyzer": "standard"},
+                        }
+                    },
+                    "furniture": {"type": "object", "enabled": False},
+                    "body": {"type": "object", "enabled": False},
+                    "groups": {"type": "object", "enabled": False},
+                    "texts": {"type": "object", "enabled": False},
+                    "pictures": {"type": "object", "enabled": False},
+                    "tables": {"type": "object", "enabled": False},
+                    "key_value_items": {"type": "object", "enabled": False},
+                    "form_items": {"type": "object", "enabled": False},
+                    "pages": {"type": "object", "enabled": False},
+                }
+            },
+            "chunk": {
+                "properties": {
+                    "text": {
+                        "type": "text",
+                        "analyzer": "standard",
+                        "fields": {
+                            "keyword": {"type": "keyword", "ignore_above": 256}
+                        },
+                    },
+                    "meta": {
+                        "properties": {
+                            "schema_name": {"type": "keyword"},
+                            "version": {"type": "keyword"},
+                            "headings": {"type": "text", "analyzer": "standard"},
+                            "origin": {
+                                "properties": {
+                                    "mimetype": {"type": "keyword"},
+                                    "binary_hash": {"type": "long"},
+                                    "filename": {
+                                        "type": "text",
+                                        "analyzer": "standard",
+                                    },
+                                }
+                            },
+                            "doc_items": {"type": "object", "enabled": False},
+                        }
+                    },
+                    "vector": {
+                        "type": "dense_vector",
+                        "dims": 768,  # Default for OpenAI embeddings, adjust as needed
+                        "index": True,
+                        "similarity": "cosine",
+                        # Keep an int8-quantized copy of the vectors for the
+                        # HNSW graph; raw floats are only read when rescoring.
+                        "index_options": {"type": "int8_hnsw"},
+                    },
+                    "document_id": {
+                        "type": "keyword"
+                    },  # Reference to parent document
+                }
+            },
+            "text": {
+                "properties": {
+                    "text_id": {"type": "keyword"},
+                    "document_id": {"type": "keyword"},
+                    "text": {
+                        "type": "text",
+                        "analyzer": "standard",
+                        "fields": {
+                            "keyword": {"type": "keyword", "ignore_above": 256}
+                        },
+                    },
+                    "label": {"type": "keyword"},
+                    "level": {"type": "integer"},
+                    "orig": {"type": "text", "analyzer": "standard"},
+                    "parent_ref": {"type": "keyword"},
+                    "children_refs": {"type": "keyword"},
+                    "prov": {"type": "object", "enabled": False},
+                }
+            },
+            "picture": {
+                "properties": {
+                    "picture_id": {"type": "keyword"},
+                    "document_id": {"type": "keyword"},
+                    "label": {"type": "keyword"},
+                    "captions": {"type": "text", "analyzer": "standard"},
+                    "references": {"type": "keyword"},
+                    "footnotes": {"type": "keyword"},
+                    "parent_ref": {"type": "keyword"},
+                    "children_refs": {"type": "keyword"},
+                    "prov": {"type": "object", "enabled": False},
+                    "image": {"type": "object", "enabled": False},
+                    "annotations": {"type": "object", "enabled": False},
+                }
+            },
+            "table": {
+                "properties": {
+                    "table_id": {"type": "keyword"},
+                    "document_id": {"type": "keyword"},
+                    "label": {"type": "keyword"},
+                    "captions": {"type": "text", "analyzer": "standard"},
+                    "references": {"type": "keyword"},
+                    "footnotes": {"type": "keyword"},
+                    "parent_ref": {"type": "keyword"},
+                    "children_refs": {"type": "keyword"},
+                    "prov": {"type": "object", "enabled": False},
+                    "data": {"type": "object", "enabled": False},
+                    "annotations": {"type": "object", "enabled": False},
+                }
+            },
+        }
+    }
+}
+
 
 class ElasticsearchConfig(BaseModel):
     """Configuration for Elasticsearch connection and indices."""
@@ -18,6 +140,10 @@ class ElasticsearchConfig(BaseModel):
     # Index settings
     index_name: str = Field(default="multimodal_index", description="Index for documents and chunks")
     vector_dimensions: int = Field(default=768, description="Dimension of embedding vectors")
+    vector_index_type: Optional[str] = Field(
+        default="int8_hnsw",
+        description="dense_vector index type, e.g. int8_hnsw, int4_hnsw, bbq_hnsw or hnsw; None uses the server default",
+    )
     
     # Index configurations
     shards: int = Field(default=1)
@@ -60,3 +186,20 @@ class ElasticsearchConfig(BaseModel):
                 }
             }
         }
+
+    @cached_property
+    def index_mapping(self) -> Dict[str, Any]:
+        """Get the index mapping with the configured vector settings.
+
+        Built once per config instance and reused for every index creation.
+        """
+        mapping = copy.deepcopy(INDEX_MAPPING)
+        vector_mapping = mapping["mappings"]["properties"]["chunk"]["properties"][
+            "vector"
+        ]
+        vector_mapping["dims"] = self.vector_dimensions
+        if self.vector_index_type:
+            vector_mapping["index_options"] = {"type": self.vector_index_type}
+        else:
+            vector_mapping.pop("index_options", None)
+        return mapping
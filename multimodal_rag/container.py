@@ -7,6 +7,12 @@ from dependency_injector import containers, providers
 from elasticsearch import AsyncElasticsearch
 from elastic_transport.client_utils import DEFAULT
 
+try:
+    # orjson is an optional extra of the Elasticsearch client
+    from elasticsearch.serializer import OrjsonSerializer
+except ImportError:
+    OrjsonSerializer = None
+
 from multimodal_rag.adaptors.elasticsearch.elasticsearch_config import ElasticsearchConfig
 from multimodal_rag.frameworks.google_genai_embedding_service import GoogleGenAIEmbeddingService
 from multimodal_rag.frameworks.google_genai_llm_service import GoogleGenAILLMService
@@ -34,6 +40,9 @@ async def elasticsearch_client_resource(
         request_timeout=60,
         # Enable HTTP compression to reduce payload size
         http_compress=True,
+        # Encode/decode request and response bodies (including bulk actions)
+        # with orjson when it is installed
+        serializer=OrjsonSerializer() if OrjsonSerializer else None,
         headers={
             "Content-Type": "application/json",
         },
@@ -60,12 +69,16 @@ class ApplicationContainer(containers.DeclarativeContainer):
         ca_certs=config.elasticsearch.ca_certs,
         index_name=config.elasticsearch.index_name,
         vector_dimensions=config.elasticsearch.vector_dimensions,
+        vector_index_type=config.elasticsearch.vector_index_type,
         shards=config.elasticsearch.shards,
         replicas=config.elasticsearch.replicas,
         default_search_size=config.elasticsearch.default_search_size,
         max_search_size=config.elasticsearch.max_search_size,
     )
 
+    # Index mapping, built once from the configured vector dimensions
+    index_mapping = elasticsearch_config.provided.index_mapping
+
     # Elasticsearch Client
     elasticsearch_client = providers.Resource(
         elasticsearch_client_resource,
@@ -87,6 +100,7 @@ class ApplicationContainer(containers.DeclarativeContainer):
         elasticsearch_client=elasticsearch_client,
         index_name=elasticsearch_config.provided.index_name,
         vector_dimensions=elasticsearch_config.provided.vector_dimensions,
+        index_mapping=index_mapping,
     )
 
     # Embedding Service
@@ -95,6 +109,8 @@ class ApplicationContainer(containers.DeclarativeContainer):
         api_keys=config.google_genai.api_keys,
         model=config.google_genai.embedding_model,
         embedding_dimensions=config.google_genai.embedding_dimensions,
+        cache_path=config.google_genai.embedding_cache_path,
+        requests_per_minute=config.google_genai.embedding_requests_per_minute,
     )
 
     # LLM Service for content generation
@@ -102,6 +118,13 @@ class ApplicationContainer(containers.DeclarativeContainer):
         GoogleGenAILLMService,
         api_keys=config.google_genai.api_keys,
         default_model=config.google_genai.default_llm_model,
+        requests_per_minute=config.google_genai.llm_requests_per_minute,
+        response_cache_path=config.google_genai.llm_cache_path,
+        response_cache_size=config.google_genai.llm_cache_size,
+        embedding_service=embedding_service,
+        semantic_cache_threshold=config.google_genai.llm_semantic_cache_threshold,
+        max_output_tokens=config.google_genai.llm_max_output_tokens,
+        max_input_tokens=config.google_genai.llm_max_input_tokens,
     )
 
     # Use Cases
@@ -1,19 +1,51 @@
 """Document entities for the multimodal RAG system."""
 
+import sys
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    computed_field,
+    field_serializer,
+    field_validator,
+)
 from docling_core.transforms.chunker.hierarchical_chunker import DocChunk as DLDocChunk
 
 
-class DocumentOrigin(BaseModel):
+# Small value objects built many times per document are plain dataclasses;
+# they carry already-typed data and don't need Pydantic validation.
+# They are frozen and, where supported (Python 3.10+), slotted.
+_VALUE_OBJECT = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _VALUE_OBJECT["slots"] = True
+
+
+@dataclass(**_VALUE_OBJECT)
+class DocumentOrigin:
     """Document origin information."""
 
     mimetype: str
     binary_hash: int
     filename: str
 
+    @classmethod
+    def from_docling(cls, origin: Any) -> "DocumentOrigin":
+        """Get the shared DocumentOrigin for a Docling document origin."""
+        return _shared_origin(origin.mimetype, origin.binary_hash, origin.filename)
+
 
-class BoundingBox(BaseModel):
+@lru_cache(maxsize=128)
+def _shared_origin(mimetype: str, binary_hash: int, filename: str) -> DocumentOrigin:
+    """Build one DocumentOrigin per source document and reuse it."""
+    return DocumentOrigin(mimetype=mimetype, binary_hash=binary_hash, filename=filename)
+
+
+@dataclass(**_VALUE_OBJECT)
+class BoundingBox:
     """Bounding box information for document elements."""
 
     left: float
@@ -25,16 +57,37 @@ class BoundingBox(BaseModel):
     @classmethod
     def from_elastic_data(cls, bbox_data: Dict[str, Any]) -> "BoundingBox":
         """Create BoundingBox from Elasticsearch data."""
+        if not bbox_data:
+            return _ZERO_BBOX
+        coord_origin = bbox_data.get("coord_origin", "TOPLEFT")
+        return cls(
+            left=float(bbox_data.get("left", bbox_data.get("l", 0))),
+            top=float(bbox_data.get("top", bbox_data.get("t", 0))),
+            right=float(bbox_data.get("right", bbox_data.get("r", 0))),
+            bottom=float(bbox_data.get("bottom", bbox_data.get("b", 0))),
+            coord_origin=getattr(coord_origin, "value", coord_origin),
+        )
+
+    @classmethod
+    def from_docling(cls, bbox: Any) -> "BoundingBox":
+        """Create BoundingBox from a Docling bounding box."""
         return cls(
-            left=bbox_data.get("left", bbox_data.get("l", 0)),
-            top=bbox_data.get("top", bbox_data.get("t", 0)),
-            right=bbox_data.get("right", bbox_data.get("r", 0)),
-            bottom=bbox_data.get("bottom", bbox_data.get("b", 0)),
-            coord_origin=bbox_data.get("coord_origin", "TOPLEFT"),
+            left=bbox.l,
+            top=bbox.t,
+            right=bbox.r,
+            bottom=bbox.b,
+            coord_origin=bbox.coord_origin.value,
         )
 
 
-class Provenance(BaseModel):
+# Shared fallback for missing bounding boxes; safe to reuse since it is frozen
+_ZERO_BBOX = BoundingBox(
+    left=0.0, top=0.0, right=0.0, bottom=0.0, coord_origin="TOPLEFT"
+)
+
+
+@dataclass(**_VALUE_OBJECT)
+class Provenance:
     """Provenance information for document elements."""
 
     page_no: int
@@ -51,6 +104,15 @@ class Provenance(BaseModel):
             charspan=prov_data.get("charspan", [0, 0]),
         )
 
+    @classmethod
+    def from_docling(cls, prov_item: Any) -> "Provenance":
+        """Create Provenance from a Docling provenance item."""
+        return cls(
+            page_no=prov_item.page_no,
+            bbox=BoundingBox.from_docling(prov_item.bbox),
+            charspan=list(prov_item.charspan),
+        )
+
 
 class DocumentText(BaseModel):
     """Entity representing a text element from a document."""
@@ -77,7 +139,7 @@ class DocumentText(BaseModel):
                 "orig": self.orig,
                 "parent_ref": self.parent_ref,
                 "children_refs": self.children_refs,
-                "prov": [prov.model_dump(mode="json") for prov in self.prov],
+                "prov": [asdict(prov) for prov in self.prov],
             }
         }
 
@@ -92,7 +154,9 @@ class DocumentText(BaseModel):
             for prov_data in text_data.get("prov", [])
         ]
 
-        return cls(
+        # Stored entities were validated before indexing; hydrate without
+        # re-validating (the other from_elastic_* constructors do the same)
+        return cls.model_construct(
             text_id=text_data.get("text_id", ""),
             document_id=text_data.get("document_id", ""),
             text=text_data.get("text", ""),
@@ -111,19 +175,39 @@ class ImageData(BaseModel):
     mimetype: str
     dpi: int
     size: Dict[str, int]  # width, height
-    uri: str  # base64 encoded image data
+    # Source of the base64 data URI: a str, or Docling's URL object which is
+    # only turned into a (potentially multi-MB) string when uri is read.
+    uri_source: Any = Field(default="", alias="uri", exclude=True, repr=False)
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    @computed_field
+    @property
+    def uri(self) -> str:
+        """Base64 encoded image data URI."""
+        return str(self.uri_source) if self.uri_source is not None else ""
 
     @classmethod
     def from_elastic_data(cls, image_data: Dict[str, Any]) -> "ImageData":
         """Create ImageData from Elasticsearch data."""
-        uri_value = image_data.get("uri", "")
-        uri_str = str(uri_value) if uri_value is not None else ""
-
-        return cls(
+        return cls.model_construct(
             mimetype=image_data.get("mimetype", "image/png"),
             dpi=image_data.get("dpi", 72),
             size=image_data.get("size", {"width": 0, "height": 0}),
-            uri=uri_str,
+            uri_source=image_data.get("uri", ""),
+        )
+
+    @classmethod
+    def from_docling(cls, image_ref: Any) -> "ImageData":
+        """Create ImageData from a Docling image reference."""
+        return cls.model_construct(
+            mimetype=image_ref.mimetype,
+            dpi=image_ref.dpi,
+            size={
+                "width": int(image_ref.size.width),
+                "height": int(image_ref.size.height),
+            },
+            uri_source=image_ref.uri,
         )
 
 
@@ -154,7 +238,7 @@ class DocumentPicture(BaseModel):
                 "footnotes": self.footnotes,
                 "parent_ref": self.parent_ref,
                 "children_refs": self.children_refs,
-                "prov": [prov.model_dump(mode="json") for prov in self.prov],
+                "prov": [asdict(prov) for prov in self.prov],
                 "image": self.image.model_dump(mode="json") if self.image else None,
                 "annotations": self.annotations,
             }
@@ -176,7 +260,7 @@ class DocumentPicture(BaseModel):
         if picture_data.get("image"):
             image_data = ImageData.from_elastic_data(picture_data["image"])
 
-        return cls(
+        return cls.model_construct(
             picture_id=picture_data.get("picture_id", ""),
             document_id=picture_data.get("document_id", ""),
             label=picture_data.get("label", "picture"),
@@ -191,7 +275,8 @@ class DocumentPicture(BaseModel):
         )
 
 
-class TableCell(BaseModel):
+@dataclass(**_VALUE_OBJECT)
+class TableCell:
     """Table cell information."""
 
     bbox: BoundingBox
@@ -224,6 +309,28 @@ class TableCell(BaseModel):
             row_section=cell_data.get("row_section", False),
         )
 
+    @classmethod
+    def from_docling(cls, cell: Any) -> "TableCell":
+        """Create TableCell from a Docling table cell."""
+        bbox = (
+            BoundingBox.from_docling(cell.bbox)
+            if cell.bbox is not None
+            else _ZERO_BBOX
+        )
+        return cls(
+            bbox=bbox,
+            row_span=cell.row_span,
+            col_span=cell.col_span,
+            start_row_offset_idx=cell.start_row_offset_idx,
+            end_row_offset_idx=cell.end_row_offset_idx,
+            start_col_offset_idx=cell.start_col_offset_idx,
+            end_col_offset_idx=cell.end_col_offset_idx,
+            text=cell.text,
+            column_header=cell.column_header,
+            row_header=cell.row_header,
+            row_section=cell.row_section,
+        )
+
 
 class TableData(BaseModel):
     """Table data structure."""
@@ -241,13 +348,23 @@ class TableData(BaseModel):
             for cell_data in data_info.get("table_cells", [])
         ]
 
-        return cls(
+        return cls.model_construct(
             table_cells=table_cells,
             num_rows=data_info.get("num_rows", 0),
             num_cols=data_info.get("num_cols", 0),
             grid=data_info.get("grid", []),
         )
 
+    @classmethod
+    def from_docling(cls, data: Any) -> "TableData":
+        """Create TableData from Docling table data."""
+        return cls.model_construct(
+            table_cells=[TableCell.from_docling(cell) for cell in data.table_cells],
+            num_rows=data.num_rows,
+            num_cols=data.num_cols,
+            grid=[[cell.model_dump() for cell in row] for row in data.grid],
+        )
+
 
 class DocumentTable(BaseModel):
     """Entity representing a table element from a document."""
@@ -276,7 +393,7 @@ class DocumentTable(BaseModel):
                 "footnotes": self.footnotes,
                 "parent_ref": self.parent_ref,
                 "children_refs": self.children_refs,
-                "prov": [prov.model_dump(mode="json") for prov in self.prov],
+                "prov": [asdict(prov) for prov in self.prov],
                 "data": self.data.model_dump(mode="json") if self.data else None,
                 "annotations": self.annotations,
             }
@@ -298,7 +415,7 @@ class DocumentTable(BaseModel):
         if table_data.get("data"):
             table_data_obj = TableData.from_elastic_data(table_data["data"])
 
-        return cls(
+        return cls.model_construct(
             table_id=table_data.get("table_id", ""),
             document_id=table_data.get("document_id", ""),
             label=table_data.get("label", "table"),
@@ -328,8 +445,25 @@ class DoclingDocument(BaseModel):
     pages: Dict[str, Any] = Field(default_factory=dict)
 
     def to_elastic_data(self) -> Dict[str, Any]:
-        """Convert to Elasticsearch indexing format."""
-        return {"document": self.model_dump(mode="json")}
+        """Convert to Elasticsearch indexing format.
+
+        The Docling sub-trees are opaque, JSON-ready blobs (stored with
+        ``enabled: false``), so they are passed through without another walk.
+        """
+        return {
+            "document": {
+                "schema_name": self.schema_name,
+                "version": self.version,
+                "name": self.name,
+                "origin": asdict(self.origin) if self.origin else None,
+                "furniture": self.furniture,
+                "body": self.body,
+                "groups": self.groups,
+                "key_value_items": self.key_value_items,
+                "form_items": self.form_items,
+                "pages": self.pages,
+            }
+        }
 
     @classmethod
     def from_elastic_hit(cls, hit_data: Dict[str, Any]) -> "DoclingDocument":
@@ -345,7 +479,7 @@ class DoclingDocument(BaseModel):
                 filename=origin_data.get("filename", ""),
             )
 
-        return cls(
+        return cls.model_construct(
             schema_name=document_data.get("schema_name", ""),
             version=document_data.get("version", ""),
             name=document_data.get("name", ""),
@@ -369,17 +503,37 @@ class DocMeta(BaseModel):
     origin: Optional[DocumentOrigin] = None
 
 
+def _as_vector(value: Any) -> Optional[np.ndarray]:
+    """Convert an embedding to a contiguous float32 array."""
+    if value is None:
+        return None
+    return np.ascontiguousarray(value, dtype=np.float32)
+
+
 class DocChunk(BaseModel):
     """Entity representing a document chunk with vector embeddings."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=True)
+
     chunk_id: Optional[str] = None
     text: str
     meta: DocMeta
     document_id: str
-    vector: Optional[List[float]] = Field(
+    vector: Optional[np.ndarray] = Field(
         default=None, description="Vector embedding for semantic search"
     )
 
+    @field_validator("vector", mode="before")
+    @classmethod
+    def _validate_vector(cls, value: Any) -> Optional[np.ndarray]:
+        """Store embeddings as float32 arrays instead of lists of floats."""
+        return _as_vector(value)
+
+    @field_serializer("vector")
+    def _serialize_vector(self, vector: Optional[np.ndarray]) -> Optional[List[float]]:
+        """Serialize the embedding as a plain list of floats."""
+        return vector.tolist() if vector is not None else None
+
     def to_elastic_data(self) -> Dict[str, Any]:
         """Convert to Elasticsearch indexing format."""
         chunk_data = {
@@ -389,8 +543,8 @@ class DocChunk(BaseModel):
             "meta": self.meta.model_dump(mode="json"),
         }
 
-        if self.vector:
-            chunk_data["vector"] = self.vector
+        if self.vector is not None and self.vector.size:
+            chunk_data["vector"] = self.vector.tolist()
 
         return {"chunk": chunk_data}
 
@@ -401,33 +555,51 @@ class DocChunk(BaseModel):
         document_id: str,
         chunk_index: int,
         vector: Optional[List[float]] = None,
+        doc_item_cache: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> "DocChunk":
-        """Create entity from Docling chunk."""
+        """Create entity from Docling chunk.
+
+        Args:
+            dl_chunk: Docling chunk to convert
+            document_id: ID of the source document
+            chunk_index: Position of the chunk within the document
+            vector: Optional embedding of the chunk text
+            doc_item_cache: Optional dict shared across the chunks of one
+                document, so doc items spanning several chunks are dumped once
+        """
         chunk_id = f"{document_id}_chunk_{chunk_index}"
         origin = None
         if dl_chunk.meta.origin:
-            origin = DocumentOrigin(
-                mimetype=dl_chunk.meta.origin.mimetype,
-                binary_hash=dl_chunk.meta.origin.binary_hash,
-                filename=dl_chunk.meta.origin.filename,
-            )
+            origin = DocumentOrigin.from_docling(dl_chunk.meta.origin)
 
-        meta = DocMeta(
+        if doc_item_cache is None:
+            doc_items = [
+                item.model_dump(mode="json") for item in dl_chunk.meta.doc_items
+            ]
+        else:
+            doc_items = []
+            for item in dl_chunk.meta.doc_items:
+                item_dump = doc_item_cache.get(item.self_ref)
+                if item_dump is None:
+                    item_dump = item.model_dump(mode="json")
+                    doc_item_cache[item.self_ref] = item_dump
+                doc_items.append(item_dump)
+
+        # Docling output is already validated, so skip re-validation here
+        meta = DocMeta.model_construct(
             schema_name=dl_chunk.meta.schema_name,
             version=dl_chunk.meta.version,
-            doc_items=[
-                item.model_dump(mode="json") for item in dl_chunk.meta.doc_items
-            ],
+            doc_items=doc_items,
             headings=dl_chunk.meta.headings,
             origin=origin,
         )
 
-        return cls(
+        return cls.model_construct(
             chunk_id=chunk_id,
             text=dl_chunk.text,
             meta=meta,
             document_id=document_id,
-            vector=vector,
+            vector=_as_vector(vector),
         )
 
     @classmethod
@@ -447,7 +619,7 @@ class DocChunk(BaseModel):
                 filename=origin_data.get("filename", ""),
             )
 
-        meta = DocMeta(
+        meta = DocMeta.model_construct(
             schema_name=meta_data.get("schema_name", ""),
             version=meta_data.get("version", ""),
             doc_items=meta_data.get("doc_items", []),
@@ -455,10 +627,10 @@ class DocChunk(BaseModel):
             origin=origin,
         )
 
-        return cls(
+        return cls.model_construct(
             chunk_id=chunk_data.get("chunk_id", ""),
             text=chunk_data.get("text", ""),
             document_id=chunk_data.get("document_id", ""),
             meta=meta,
-            vector=chunk_data.get("vector"),
+            vector=_as_vector(chunk_data.get("vector")),
         )
@@ -1,4 +1,5 @@
-from typing import List
+from typing import Any, Callable, Dict, List, Sequence, Type
+from pydantic import BaseModel, TypeAdapter
 from docling_core.types.doc.document import DoclingDocument as DLDocument
 from .document import (
     DocumentOrigin,
@@ -12,6 +13,102 @@ from .document import (
 )
 
 
+# List adapters for the Docling document's item lists: dumping a whole list
+# in one call is cheaper than calling model_dump() on every item.
+_GROUPS_ADAPTER = TypeAdapter(DLDocument.model_fields["groups"].annotation)
+_KEY_VALUE_ITEMS_ADAPTER = TypeAdapter(
+    DLDocument.model_fields["key_value_items"].annotation
+)
+_FORM_ITEMS_ADAPTER = TypeAdapter(DLDocument.model_fields["form_items"].annotation)
+
+
+def _label_value(label) -> str:
+    """Return the plain string value of a Docling label enum."""
+    return getattr(label, "value", label)
+
+
+def _refs(items: Any) -> List[str]:
+    """Return the JSON pointer strings of Docling references."""
+    if not items:
+        return []
+    return [
+        item.cref if hasattr(item, "cref") else item.get("$ref", "") for item in items
+    ]
+
+
+def _text_fields(item: Any) -> Dict[str, Any]:
+    """Fields specific to text elements."""
+    return {
+        "text": item.text,
+        "level": getattr(item, "level", None),
+        "orig": item.orig,
+    }
+
+
+def _floating_fields(item: Any) -> Dict[str, Any]:
+    """Fields shared by pictures and tables."""
+    return {
+        "captions": _refs(item.captions),
+        "references": _refs(item.references),
+        "footnotes": _refs(item.footnotes),
+        "annotations": [
+            annotation.model_dump(mode="json") for annotation in getattr(item, "annotations", [])
+        ],
+    }
+
+
+def _picture_fields(item: Any) -> Dict[str, Any]:
+    """Fields specific to picture elements."""
+    fields = _floating_fields(item)
+    fields["image"] = ImageData.from_docling(item.image) if item.image else None
+    return fields
+
+
+def _table_fields(item: Any) -> Dict[str, Any]:
+    """Fields specific to table elements."""
+    fields = _floating_fields(item)
+    fields["data"] = TableData.from_docling(item.data) if item.data else None
+    return fields
+
+
+def _build_elements(
+    items: Sequence[Any],
+    document_id: str,
+    id_field: str,
+    id_prefix: str,
+    entity_cls: Type[BaseModel],
+    extra_fields: Callable[[Any], Dict[str, Any]],
+) -> List[Any]:
+    """Build content entities of one kind from Docling items.
+
+    Args:
+        items: Docling texts, pictures or tables
+        document_id: ID of the source document
+        id_field: Name of the entity's ID field
+        id_prefix: Prefix prepended to each item's local ID
+        entity_cls: Entity class to build
+        extra_fields: Returns the fields specific to this element kind
+
+    Returns:
+        List of entities in the same order as ``items``
+    """
+    elements = [None] * len(items)
+    # Docling output is already validated, so skip re-validation here
+    construct = entity_cls.model_construct
+    for i, item in enumerate(items):
+        local_id = item.self_ref.rpartition("/")[2] if item.self_ref else str(i)
+        elements[i] = construct(
+            **{id_field: id_prefix + local_id},
+            document_id=document_id,
+            label=_label_value(item.label),
+            prov=[Provenance.from_docling(prov) for prov in item.prov],
+            parent_ref=item.parent.cref if item.parent else None,
+            children_refs=_refs(item.children),
+            **extra_fields(item),
+        )
+    return elements
+
+
 def create_document_entities_from_docling(
     dl_doc: DLDocument, document_id: str
 ) -> tuple[
@@ -20,123 +117,48 @@ def create_document_entities_from_docling(
     """Create entities from Docling document, separating content elements."""
     origin = None
     if dl_doc.origin:
-        origin = DocumentOrigin(
-            mimetype=dl_doc.origin.mimetype,
-            binary_hash=dl_doc.origin.binary_hash,
-            filename=dl_doc.origin.filename,
-        )
+        origin = DocumentOrigin.from_docling(dl_doc.origin)
 
-    # Create main document without content elements
-    document = DoclingDocument(
+    # Docling output is already validated, so entities are built with
+    # model_construct to skip a second validation pass.
+    document = DoclingDocument.model_construct(
         schema_name=dl_doc.schema_name,
         version=dl_doc.version,
         name=dl_doc.name,
         origin=origin,
-        furniture=dl_doc.furniture.model_dump() if dl_doc.furniture else {},
-        body=dl_doc.body.model_dump() if dl_doc.body else {},
-        groups=[group.model_dump() for group in dl_doc.groups],
-        key_value_items=[kv.model_dump() for kv in dl_doc.key_value_items],
-        form_items=[form.model_dump() for form in dl_doc.form_items],
+        furniture=dl_doc.furniture.model_dump(mode="json") if dl_doc.furniture else {},
+        body=dl_doc.body.model_dump(mode="json") if dl_doc.body else {},
+        groups=_GROUPS_ADAPTER.dump_python(dl_doc.groups, mode="json"),
+        key_value_items=_KEY_VALUE_ITEMS_ADAPTER.dump_python(
+            dl_doc.key_value_items, mode="json"
+        ),
+        form_items=_FORM_ITEMS_ADAPTER.dump_python(dl_doc.form_items, mode="json"),
         # pages={str(k): v.model_dump() for k, v in dl_doc.pages.items()},
     )
 
-    texts = []
-    for i, text_data in enumerate(dl_doc.texts):
-        text_dict = (
-            text_data.model_dump() if hasattr(text_data, "model_dump") else text_data
-        )
-
-        prov_list = []
-        for prov_data in text_dict.get("prov", []):
-            prov_list.append(Provenance.from_elastic_data(prov_data))
-
-        text_id = text_dict.get("self_ref", "").split("/")[-1] if text_dict.get("self_ref") else str(i)
-        text_element = DocumentText(
-            text_id=f"{document_id}_text_{text_id}",
-            document_id=document_id,
-            text=text_dict.get("text", ""),
-            label=text_dict.get("label", "text"),
-            level=text_dict.get("level"),
-            prov=prov_list,
-            orig=text_dict.get("orig"),
-            parent_ref=text_dict.get("parent", {}).get("$ref")
-            if text_dict.get("parent")
-            else None,
-            children_refs=[
-                child.get("$ref", "") for child in text_dict.get("children", [])
-            ],
-        )
-        texts.append(text_element)
-
-    pictures = []
-    for i, pic_data in enumerate(dl_doc.pictures):
-        pic_dict = (
-            pic_data.model_dump() if hasattr(pic_data, "model_dump") else pic_data
-        )
-
-        prov_list = []
-        for prov_data in pic_dict.get("prov", []):
-            prov_list.append(Provenance.from_elastic_data(prov_data))
-
-        image_data = None
-        if "image" in pic_dict:
-            image_data = ImageData.from_elastic_data(pic_dict["image"])
-
-        picture_id = pic_dict.get("self_ref", "").split("/")[-1] if pic_dict.get("self_ref") else str(i)
-        picture_element = DocumentPicture(
-            picture_id=f"{document_id}_picture_{picture_id}",
-            document_id=document_id,
-            label=pic_dict.get("label", "picture"),
-            prov=prov_list,
-            image=image_data,
-            captions=[cap.get("$ref", "") for cap in pic_dict.get("captions", [])],
-            references=[ref.get("$ref", "") for ref in pic_dict.get("references", [])],
-            footnotes=[fn.get("$ref", "") for fn in pic_dict.get("footnotes", [])],
-            annotations=pic_dict.get("annotations", []),
-            parent_ref=pic_dict.get("parent", {}).get("$ref")
-            if pic_dict.get("parent")
-            else None,
-            children_refs=[
-                child.get("$ref", "") for child in pic_dict.get("children", [])
-            ],
-        )
-        pictures.append(picture_element)
-
-    # Extract table elements
-    tables = []
-    for i, table_data in enumerate(dl_doc.tables):
-        table_dict = (
-            table_data.model_dump() if hasattr(table_data, "model_dump") else table_data
-        )
-
-        prov_list = []
-        for prov_data in table_dict.get("prov", []):
-            prov_list.append(Provenance.from_elastic_data(prov_data))
-
-        table_data_obj = None
-        if "data" in table_dict:
-            table_data_obj = TableData.from_elastic_data(table_dict["data"])
-
-        table_id = table_dict.get("self_ref", "").split("/")[-1] if table_dict.get("self_ref") else str(i)
-        table_element = DocumentTable(
-            table_id=f"{document_id}_table_{table_id}",
-            document_id=document_id,
-            label=table_dict.get("label", "table"),
-            prov=prov_list,
-            data=table_data_obj,
-            captions=[cap.get("$ref", "") for cap in table_dict.get("captions", [])],
-            references=[
-                ref.get("$ref", "") for ref in table_dict.get("references", [])
-            ],
-            footnotes=[fn.get("$ref", "") for fn in table_dict.get("footnotes", [])],
-            annotations=table_dict.get("annotations", []),
-            parent_ref=table_dict.get("parent", {}).get("$ref")
-            if table_dict.get("parent")
-            else None,
-            children_refs=[
-                child.get("$ref", "") for child in table_dict.get("children", [])
-            ],
-        )
-        tables.append(table_element)
+    texts = _build_elements(
+        dl_doc.texts,
+        document_id,
+        "text_id",
+        f"{document_id}_text_",
+        DocumentText,
+        _text_fields,
+    )
+    pictures = _build_elements(
+        dl_doc.pictures,
+        document_id,
+        "picture_id",
+        f"{document_id}_picture_",
+        DocumentPicture,
+        _picture_fields,
+    )
+    tables = _build_elements(
+        dl_doc.tables,
+        document_id,
+        "table_id",
+        f"{document_id}_table_",
+        DocumentTable,
+        _table_fields,
+    )
 
     return document, texts, pictures, tables
@@ -0,0 +1,109 @@
+"""Circuit breaker for calls to an external API."""
+
+import threading
+import time
+
+from multimodal_rag.frameworks.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class CircuitBreaker:
+    """Stops calling an API that keeps failing, then probes it again.
+
+    The breaker is closed while calls succeed. After ``failure_threshold``
+    consecutive failures it opens and rejects calls for ``open_seconds``,
+    after which it lets up to ``half_open_requests`` trial calls through. A
+    trial that succeeds closes the breaker again; one that fails reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        open_seconds: float = 10.0,
+        half_open_requests: int = 3,
+        name: str = "",
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            open_seconds: How long an open breaker rejects calls
+            half_open_requests: Trial calls allowed once the open period ends
+            name: Name used in log messages
+        """
+        self._failure_threshold = failure_threshold
+        self._open_seconds = open_seconds
+        self._half_open_requests = half_open_requests
+        self._name = name
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+
+    @property
+    def state(self) -> str:
+        """Current state, without accounting for an elapsed open period."""
+        return self._state
+
+    def _half_open_due(self, now: float) -> bool:
+        """Whether an open breaker has waited long enough to probe again."""
+        return self._state == self.OPEN and now - self._opened_at >= self._open_seconds
+
+    def available(self) -> bool:
+        """Return whether a call would currently be allowed, without taking it."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN:
+                return self._trials < self._half_open_requests
+            return self._half_open_due(time.monotonic())
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may be made, counting it as a trial if half open.
+
+        Returns:
+            True if the call may proceed, False if it should fail fast
+        """
+        with self._lock:
+            if self._half_open_due(time.monotonic()):
+                self._state = self.HALF_OPEN
+                self._trials = 0
+                logger.info("Circuit %s half open, probing", self._name)
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and self._trials < self._half_open_requests:
+                self._trials += 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record that the API responded, closing the breaker."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("Circuit %s closed", self._name)
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker once failures pile up."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED
+                and self._failures >= self._failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                logger.warning(
+                    "Circuit %s open after %d consecutive failures",
+                    self._name,
+                    self._failures,
+                )
@@ -0,0 +1,164 @@
+"""Cache for embedding vectors keyed by content hash."""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from multimodal_rag.frameworks.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# SQLite limits the number of bound parameters per statement
+_MAX_QUERY_PARAMS = 900
+
+
+class EmbeddingCache:
+    """Two-tier store of embeddings, keyed by a hash of model, size and text.
+
+    Recently used vectors are kept in an in-process LRU; an optional SQLite
+    file persists them across runs as raw float32 bytes. Disk reads and writes
+    run in a worker thread so they don't block the event loop. Vectors are
+    returned read-only, since they are shared with the cache. Cache failures
+    are logged and treated as misses so that they never break embedding
+    generation.
+    """
+
+    def __init__(self, path: Optional[str] = None, memory_size: int = 10_000):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            path: Optional path of the SQLite database file
+            memory_size: Maximum number of embeddings kept in memory (0 disables)
+        """
+        self._lock = threading.Lock()
+        # Separate lock for the connection, so that memory lookups on the
+        # event loop never wait for a disk query in a worker thread
+        self._db_lock = threading.Lock()
+        self._memory: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._memory_size = memory_size
+
+        self._connection = None
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._connection.commit()
+
+    @staticmethod
+    def make_key(model: str, dimensions: int, text: str) -> bytes:
+        """Build the cache key for a text embedded with the given model and size."""
+        return hashlib.blake2b(
+            f"{model}\0{dimensions}\0{text}".encode("utf-8"), digest_size=16
+        ).digest()
+
+    async def get(self, key: bytes) -> Optional[np.ndarray]:
+        """Get a cached embedding, or None if it is not cached."""
+        return (await self.get_many([key])).get(key)
+
+    async def get_many(self, keys: Sequence[bytes]) -> Dict[bytes, np.ndarray]:
+        """
+        Get all cached embeddings among the given keys.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Mapping from key to embedding for the keys that were found
+        """
+        found = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+
+        missing = [key for key in keys if key not in found]
+        if missing and self._connection is not None:
+            from_disk = await asyncio.to_thread(self._get_from_disk, missing)
+            found.update(from_disk)
+            self._remember(from_disk)
+        return found
+
+    def _get_from_disk(self, keys: Sequence[bytes]) -> Dict[bytes, np.ndarray]:
+        """Look up embeddings in the SQLite store."""
+        found = {}
+        try:
+            with self._db_lock:
+                for start in range(0, len(keys), _MAX_QUERY_PARAMS):
+                    batch = keys[start : start + _MAX_QUERY_PARAMS]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = self._connection.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                        batch,
+                    ).fetchall()
+                    for key, vector in rows:
+                        # Read-only, as it shares the bytes object's buffer
+                        found[key] = np.frombuffer(vector, dtype=np.float32)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+        return found
+
+    def _remember(self, items: Dict[bytes, np.ndarray]) -> None:
+        """Add embeddings to the in-memory LRU, evicting the oldest ones."""
+        if self._memory_size <= 0 or not items:
+            return
+        with self._lock:
+            for key, vector in items.items():
+                self._memory[key] = vector
+                self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_size:
+                self._memory.popitem(last=False)
+
+    async def set_many(self, items: Dict[bytes, Sequence[float]]) -> None:
+        """
+        Store embeddings in the cache.
+
+        Args:
+            items: Mapping from cache key to embedding vector
+        """
+        if not items:
+            return
+        # Copy so that cached rows don't keep whole result matrices alive, and
+        # so that callers can't change them through the arrays they passed in
+        vectors = {}
+        for key, vector in items.items():
+            vector = np.array(vector, dtype=np.float32)
+            vector.setflags(write=False)
+            vectors[key] = vector
+        self._remember(vectors)
+        if self._connection is None:
+            return
+
+        rows = [(key, vector.tobytes()) for key, vector in vectors.items()]
+        await asyncio.to_thread(self._write_to_disk, rows)
+
+    def _write_to_disk(self, rows: List[Tuple[bytes, bytes]]) -> None:
+        """Store serialized embeddings in the SQLite store."""
+        try:
+            with self._db_lock:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    rows,
+                )
+                self._connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    def close(self) -> None:
+        """Close the underlying database connection, if any."""
+        with self._db_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
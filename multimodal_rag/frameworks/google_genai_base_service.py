@@ -1,34 +1,148 @@
 """Base Google GenAI service with common exception handling and token switching."""
 
+import asyncio
+import inspect
+import random
 import re
+import threading
 import time
-from typing import Union, List, TypeVar
+from typing import Any, Callable, Dict, Optional, Set, Union, List, TypeVar
+
+import httpx
 from google import genai
+from google.genai.errors import ClientError
 from google.genai.types import HttpOptions
 
+try:
+    # HTTP/2 support is an optional extra of httpx (httpx[http2])
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+from multimodal_rag.frameworks.circuit_breaker import CircuitBreaker
 from multimodal_rag.frameworks.logging_config import get_logger
+from multimodal_rag.frameworks.rate_tracker import RateTracker
 
 logger = get_logger(__name__)
 
 T = TypeVar('T')
 
+# Retry delay hints in error messages, compiled once for the error path
+_DELAY_SEC_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:seconds?|secs?|s)\b", re.IGNORECASE)
+_RETRY_DELAY_RE = re.compile(r"retry[_\s]*delay[:\s]*(\d+(?:\.\d+)?)", re.IGNORECASE)
+_RATE_LIMIT_RE = re.compile(r"rate limit|quota|429|too many requests", re.IGNORECASE)
+
+# Exponential backoff between retries without a server delay hint, in seconds
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 60.0
+
+# Clients shared by all services in the process, one per API key, so that
+# services using the same key also share its HTTP connection pool
+_CLIENT_POOL: Dict[str, genai.Client] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
+
+def _shared_client(api_key: str) -> genai.Client:
+    """Return the process-wide client for an API key, creating it if needed."""
+    with _CLIENT_POOL_LOCK:
+        client = _CLIENT_POOL.get(api_key)
+        if client is None:
+            client = genai.Client(api_key=api_key, http_options=_http_options())
+            _CLIENT_POOL[api_key] = client
+        return client
+
+
+def _http_options() -> HttpOptions:
+    """HTTP options of the shared clients.
+
+    With HTTP/2 available, async requests go through a pooled HTTP/2 httpx
+    transport that multiplexes concurrent calls over a few connections.
+    Otherwise the SDK's default keep-alive pool is used.
+    """
+    if not _HTTP2_AVAILABLE:
+        return HttpOptions(timeout=60000)
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+    return HttpOptions(timeout=60000, async_client_args={"transport": transport})
+
+
+async def close_shared_clients() -> None:
+    """Close the connection pools of all shared clients."""
+    with _CLIENT_POOL_LOCK:
+        clients = list(_CLIENT_POOL.values())
+        _CLIENT_POOL.clear()
+    for client in clients:
+        try:
+            await client.aio.aclose()
+            client.close()
+        except Exception as e:
+            logger.warning("Failed to close GenAI client: %s", e)
+
+
+def _structured_retry_delay(error: Exception) -> Optional[float]:
+    """Read the retry delay the server attached to an API error, if any."""
+    try:
+        # google.rpc.RetryInfo in the error body, e.g. {"retryDelay": "22s"}
+        details = getattr(error, "details", None)
+        if isinstance(details, dict):
+            for detail in details.get("error", details).get("details") or []:
+                if isinstance(detail, dict) and "retryDelay" in detail:
+                    return float(str(detail["retryDelay"]).rstrip("s"))
+
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if headers:
+            retry_after = headers.get("retry-after")
+            if retry_after is not None:
+                return float(retry_after)
+    except (AttributeError, TypeError, ValueError):
+        pass
+    return None
+
+
+def _jittered(delay: float) -> float:
+    """Stretch a server-provided delay by up to 10%.
+
+    Callers throttled together would otherwise all retry at the same
+    instant; the delay is never shortened.
+    """
+    return delay * random.uniform(1.0, 1.1)
+
+
+def _retry_delay_hint(error: Exception) -> Optional[float]:
+    """Return the retry delay requested by the server, or None if it gave none."""
+    retry_delay = _structured_retry_delay(error)
+    if retry_delay is not None:
+        return retry_delay
 
-def parse_retry_delay_from_error(error: Exception) -> float:
-    """Extract retry delay from error message."""
     error_str = str(error)
-    # Look for patterns like "retry after 15 seconds" or "15s"
-    match = re.search(r"(\d+(?:\.\d+)?)\s*(?:second|sec|s)", error_str, re.IGNORECASE)
+    lowered = error_str.lower()
+    # Only messages mentioning a retry or seconds can carry a delay hint
+    if "retry" not in lowered and "sec" not in lowered:
+        return None
+
+    # Look for patterns like "retry_delay: 15" first, as they are more specific
+    match = _RETRY_DELAY_RE.search(error_str)
     if match:
         return float(match.group(1))
 
-    # Look for patterns like "retry_delay: 15"
-    match = re.search(
-        r"retry[_\s]*delay[:\s]*(\d+(?:\.\d+)?)", error_str, re.IGNORECASE
-    )
+    # Look for patterns like "retry after 15 seconds" or "retry in 15s"
+    match = _DELAY_SEC_RE.search(error_str)
     if match:
         return float(match.group(1))
 
-    return 60.0  # Default to 60 seconds if no retry delay found
+    return None
+
+
+def parse_retry_delay_from_error(error: Exception) -> float:
+    """Extract retry delay from the error details, falling back to its message."""
+    retry_delay = _retry_delay_hint(error)
+    if retry_delay is None:
+        return 60.0  # Default to 60 seconds if no retry delay found
+    return retry_delay
 
 
 class GoogleGenAIBaseService:
@@ -38,6 +152,7 @@ class GoogleGenAIBaseService:
         self,
         api_keys: Union[str, List[str]],
         max_retries: int = 7,
+        requests_per_minute: Optional[int] = None,
     ):
         """
         Initialize the base Google GenAI service.
@@ -45,6 +160,8 @@ class GoogleGenAIBaseService:
         Args:
             api_keys: Single API key string or list of API keys for token switching
             max_retries: Maximum number of retries for failed requests
+            requests_per_minute: Optional per-key request limit enforced on the
+                client side before calling the API
         """
         if isinstance(api_keys, str):
             self._api_keys = [api_keys]
@@ -53,41 +170,208 @@ class GoogleGenAIBaseService:
         
         self._token_index = 0
         self._max_retries = max_retries
+        # Operations may run concurrently in worker threads
+        self._switch_lock = threading.Lock()
+        # Operation name -> method performing one API call, filled by
+        # subclasses; it gets the client of the API key to use as first argument
+        self._operations: Dict[str, Callable[..., Any]] = {}
 
-        # Initialize client with first API key
-        self._client = genai.Client(
-            api_key=self._api_keys[0], http_options=HttpOptions(timeout=60000)
-        )
+        # Clients of the API keys used so far, taken from the shared pool on
+        # first use, since creating one is expensive
+        self._clients: List[Optional[genai.Client]] = [None] * len(self._api_keys)
+        # Monotonic time at which each key may be used again after a rate limit
+        self._key_cooldown = [0.0] * len(self._api_keys)
+        # Fail fast on keys whose calls keep failing, e.g. during an outage
+        self._breakers = [
+            CircuitBreaker(name=f"API key index {i}")
+            for i in range(len(self._api_keys))
+        ]
+        self._rate_tracker = None
+        if requests_per_minute:
+            self._rate_tracker = RateTracker(len(self._api_keys), requests_per_minute)
+
+    def _get_client(self, key_index: int) -> genai.Client:
+        """Return the client of an API key, creating it on first use."""
+        client = self._clients[key_index]
+        if client is None:
+            client = _shared_client(self._api_keys[key_index])
+            self._clients[key_index] = client
+        return client
 
-    def _switch_to_next_api_key(self) -> bool:
+    def _select_next_api_key(self, exclude: Set[int] = frozenset()) -> Optional[float]:
         """
-        Switch to the next available API key.
+        Switch to the next API key that is not cooling down after a rate limit.
+
+        Keys are tried in round-robin order. If every key is still cooling
+        down, the one that becomes available first is selected.
+
+        Args:
+            exclude: Indices of API keys that must not be selected, such as
+                the ones a call has already tried
 
         Returns:
-            True if switched to a new key, False if no more keys available
+            Seconds to wait before the selected key can be used, or None if
+            there is no other key to switch to
         """
         if len(self._api_keys) <= 1:
-            return False
+            return None
 
-        self._token_index = (self._token_index + 1) % len(self._api_keys)
-        new_api_key = self._api_keys[self._token_index]
+        with self._switch_lock:
+            now = time.monotonic()
+            candidates = [
+                index
+                for index in (
+                    (self._token_index + offset) % len(self._clients)
+                    for offset in range(1, len(self._clients) + 1)
+                )
+                if index not in exclude
+            ]
+            if not candidates:
+                return None
+            next_index = next(
+                (i for i in candidates if self._key_cooldown[i] <= now), None
+            )
+            wait = 0.0
+            if next_index is None:
+                next_index = min(candidates, key=self._key_cooldown.__getitem__)
+                wait = self._key_cooldown[next_index] - now
 
-        self._client = genai.Client(
-            api_key=new_api_key, http_options=HttpOptions(timeout=60000)
-        )
+            self._token_index = next_index
 
-        logger.info(f"Switched to API key index {self._token_index}")
+        logger.info("Switched to API key index %d", next_index)
 
-        # If we've cycled back to token 0, we've tried all tokens, delay 60 seconds
-        if self._token_index == 0:
+        if wait > 0:
             logger.warning(
-                "Cycled back to token 0, waiting 60 seconds before continuing"
+                "All API keys are rate limited, waiting %.1f seconds before continuing",
+                wait,
             )
-            time.sleep(60)
+        return wait
 
+    async def _switch_to_next_api_key(self, exclude: Set[int] = frozenset()) -> bool:
+        """
+        Switch to the next available API key, waiting if all keys are cooling down.
+
+        Args:
+            exclude: Indices of API keys that must not be selected
+
+        Returns:
+            True if switched to a new key, False if no more keys available
+        """
+        wait = self._select_next_api_key(exclude)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
         return True
 
-    def _execute_with_retry_and_token_switching(
+    def _handle_operation_error(
+        self, operation_name: str, error: Exception, attempt: int, key_index: int
+    ) -> Optional[float]:
+        """
+        Decide how to proceed after a failed attempt.
+
+        Args:
+            operation_name: Name of the operation for logging
+            error: Exception raised by the attempt
+            attempt: Zero-based attempt number with the current API key
+            key_index: Index of the API key used by the attempt
+
+        Returns:
+            Seconds to wait before retrying with the same key, or None to give
+            up on this key and switch to the next one
+        """
+        breaker = self._breakers[key_index]
+        if _RATE_LIMIT_RE.search(str(error)):
+            # The API is up, it only asks to slow down
+            breaker.record_success()
+            self._key_cooldown[key_index] = time.monotonic() + _jittered(
+                parse_retry_delay_from_error(error)
+            )
+            # Immediately switch to next token on rate limit error
+            logger.warning(
+                "Rate limit error with API key index %d, switching immediately",
+                key_index,
+            )
+            return None
+
+        if isinstance(error, ClientError):
+            # Rejected requests don't indicate an outage, and sending the same
+            # request again with this key would be rejected the same way
+            breaker.record_success()
+            logger.error(
+                "Request rejected executing %s with API key index %d: %s",
+                operation_name,
+                key_index,
+                error,
+            )
+            return None
+
+        breaker.record_failure()
+        if breaker.state == CircuitBreaker.OPEN:
+            logger.error(
+                "Error executing %s, circuit open for API key index %d: %s",
+                operation_name,
+                key_index,
+                error,
+            )
+            return None
+
+        if attempt == self._max_retries:
+            logger.error(
+                "Error executing %s after %d attempts with API key index %d: %s",
+                operation_name,
+                self._max_retries + 1,
+                key_index,
+                error,
+            )
+            return None
+
+        retry_delay = self._backoff(attempt, _retry_delay_hint(error))
+
+        logger.warning(
+            "Error executing %s (attempt %d/%d), retrying in %.2fs: %s",
+            operation_name,
+            attempt + 1,
+            self._max_retries + 1,
+            retry_delay,
+            error,
+        )
+        return retry_delay
+
+    @staticmethod
+    def _backoff(attempt: int, server_hint: Optional[float] = None) -> float:
+        """
+        Compute the wait before retrying with the same API key.
+
+        Args:
+            attempt: Zero-based attempt number that just failed
+            server_hint: Retry delay requested by the server, if any
+
+        Returns:
+            Capped exponential backoff with full jitter, raised to at least
+            the server's delay when it gave one
+        """
+        delay = random.uniform(0, min(_BACKOFF_CAP, _BACKOFF_BASE * 2**attempt))
+        if server_hint is not None:
+            delay = max(delay, _jittered(server_hint))
+        return delay
+
+    def _raise_if_all_circuits_open(self, operation_name: str) -> None:
+        """
+        Fail fast when no API key would currently be allowed to make a call.
+
+        Args:
+            operation_name: Name of the operation for the error message
+
+        Raises:
+            RuntimeError: If the circuit of every API key is open
+        """
+        if not any(breaker.available() for breaker in self._breakers):
+            raise RuntimeError(
+                f"Circuit open for all API keys, not executing {operation_name}"
+            )
+
+    async def _execute_with_retry_and_token_switching(
         self,
         operation_name: str,
         *args,
@@ -96,8 +380,16 @@ class GoogleGenAIBaseService:
         """
         Execute an operation with retry logic and token switching.
 
+        Coroutine operations are awaited directly; blocking ones run in a
+        worker thread. All waits between attempts use asyncio.sleep, so
+        retries never block the event loop.
+
+        Each attempt is sent with the client of the API key this call picked,
+        so a key switch made by a concurrent call doesn't move its retries
+        to a key whose cooldown, rate window and circuit they aren't charged to.
+
         Args:
-            operation_name: Name of the operation for logging
+            operation_name: Name of a registered operation
             *args: Arguments to pass to the operation method
             **kwargs: Keyword arguments to pass to the operation method
 
@@ -105,57 +397,61 @@ class GoogleGenAIBaseService:
             Result of the operation
 
         Raises:
-            RuntimeError: If all API keys fail
+            RuntimeError: If all API keys fail or their circuits are open
         """
-        operation_method_name = f"_execute_{operation_name.replace(' ', '_').replace(':', '').lower()}"
-        
+        operation_method = self._operations[operation_name]
+        is_coroutine = inspect.iscoroutinefunction(operation_method)
+
+        # Every key is tried at most once per call, so a request that keeps
+        # failing ends with an error instead of cycling through the keys forever
+        tried_keys: Set[int] = set()
         while True:
             current_key_index = self._token_index
+            tried_keys.add(current_key_index)
+            client = self._get_client(current_key_index)
 
-            logger.info(f"Trying {operation_name} with API key index {current_key_index}")
+            if self._breakers[current_key_index].allow():
+                logger.info(
+                    "Trying %s with API key index %d", operation_name, current_key_index
+                )
+                attempts = range(self._max_retries + 1)
+            else:
+                logger.warning(
+                    "Circuit open for API key index %d, skipping it", current_key_index
+                )
+                attempts = range(0)
 
-            for attempt in range(self._max_retries + 1):
+            for attempt in attempts:
                 try:
-                    logger.debug(f"Executing {operation_name} (attempt {attempt + 1})")
-                    operation_method = getattr(self, operation_method_name)
-                    result = operation_method(*args, **kwargs)
-                    logger.info(f"Successfully executed {operation_name} with API key index {current_key_index}")
+                    logger.debug(
+                        "Executing %s (attempt %d)", operation_name, attempt + 1
+                    )
+                    if self._rate_tracker is not None:
+                        await self._rate_tracker.aacquire(current_key_index)
+                    if is_coroutine:
+                        result = await operation_method(client, *args, **kwargs)
+                    else:
+                        result = await asyncio.to_thread(
+                            operation_method, client, *args, **kwargs
+                        )
+                    self._breakers[current_key_index].record_success()
+                    logger.info(
+                        "Successfully executed %s with API key index %d",
+                        operation_name,
+                        current_key_index,
+                    )
                     return result
 
                 except Exception as e:
-                    error_str = str(e).lower()
-                    is_rate_limit_error = any(
-                        term in error_str
-                        for term in ["rate limit", "quota", "429", "too many requests"]
+                    retry_delay = self._handle_operation_error(
+                        operation_name, e, attempt, current_key_index
                     )
-
-                    if is_rate_limit_error:
-                        # Immediately switch to next token on rate limit error
-                        logger.warning(
-                            f"Rate limit error with API key index {current_key_index}, switching immediately"
-                        )
-                        break
-                    elif attempt == self._max_retries:
-                        logger.error(
-                            f"Error executing {operation_name} after {self._max_retries + 1} attempts with API key index {current_key_index}: {str(e)}"
-                        )
+                    if retry_delay is None:
                         break
-                    else:
-                        # Try to parse retry delay from error message, fallback to exponential backoff
-                        retry_delay = parse_retry_delay_from_error(e)
-                        if (
-                            retry_delay == 60.0
-                        ):  # Default value means no specific delay found
-                            retry_delay = min(
-                                2**attempt, 60
-                            )  # Exponential backoff with max 60s
-
-                        logger.warning(
-                            f"Error executing {operation_name} (attempt {attempt + 1}/{self._max_retries + 1}), retrying in {retry_delay}s: {str(e)}"
-                        )
-                        time.sleep(retry_delay)
+                    await asyncio.sleep(retry_delay)
 
-            if not self._switch_to_next_api_key():
+            self._raise_if_all_circuits_open(operation_name)
+            if not await self._switch_to_next_api_key(tried_keys):
                 break
 
         raise RuntimeError(
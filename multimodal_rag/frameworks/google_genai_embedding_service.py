@@ -1,15 +1,49 @@
 """Google GenAI embedding service implementation."""
 
-from typing import List, Union
+import asyncio
+import random
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+from google import genai
 
 from multimodal_rag.usecases.interfaces.embedding_service import (
     EmbeddingServiceInterface,
 )
+from multimodal_rag.frameworks.embedding_cache import EmbeddingCache
 from multimodal_rag.frameworks.google_genai_base_service import GoogleGenAIBaseService
 from multimodal_rag.frameworks.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum number of texts the Gemini API accepts in one embed_content request
+MAX_BATCH_SIZE = 100
+# Cap on the total characters sent in one request, to stay well below the
+# request token limit when texts are long
+MAX_BATCH_CHARS = 20_000
+
+
+def _partition(
+    items: List[str],
+    max_items: int = MAX_BATCH_SIZE,
+    max_chars: int = MAX_BATCH_CHARS,
+) -> Iterator[List[str]]:
+    """Split items into consecutive batches limited by count and total length.
+
+    A single text longer than ``max_chars`` is sent in a batch of its own.
+    """
+    batch: List[str] = []
+    batch_chars = 0
+    for item in items:
+        if batch and (len(batch) == max_items or batch_chars + len(item) > max_chars):
+            yield batch
+            batch = []
+            batch_chars = 0
+        batch.append(item)
+        batch_chars += len(item)
+    if batch:
+        yield batch
+
 
 class GoogleGenAIEmbeddingService(GoogleGenAIBaseService, EmbeddingServiceInterface):
     """Google GenAI implementation of the embedding service."""
@@ -20,6 +54,10 @@ class GoogleGenAIEmbeddingService(GoogleGenAIBaseService, EmbeddingServiceInterf
         model: str = "gemini-embedding-001",
         embedding_dimensions: int = 768,
         max_retries: int = 7,
+        cache_path: Optional[str] = None,
+        memory_cache_size: int = 10_000,
+        max_concurrent_batches: int = 4,
+        requests_per_minute: Optional[int] = None,
     ):
         """
         Initialize the Google GenAI embedding service.
@@ -29,33 +67,91 @@ class GoogleGenAIEmbeddingService(GoogleGenAIBaseService, EmbeddingServiceInterf
             model: Model name for embeddings
             embedding_dimensions: Number of dimensions for embeddings
             max_retries: Maximum number of retries for failed requests
+            cache_path: Optional SQLite file for caching embeddings across runs
+            memory_cache_size: Number of embeddings kept in an in-process LRU
+                (0 disables it)
+            max_concurrent_batches: Maximum number of batch requests in flight
+                at once for a single embed_content call
+            requests_per_minute: Optional per-key request limit enforced on the
+                client side before calling the API
         """
-        super().__init__(api_keys, max_retries)
+        super().__init__(api_keys, max_retries, requests_per_minute)
         self._model = model
         self._embedding_dimensions = embedding_dimensions
+        self._max_concurrent_batches = max_concurrent_batches
+        self._in_flight: Dict[bytes, "asyncio.Future[np.ndarray]"] = {}
+        self._operations.update(
+            embeddings_for_content=self._execute_embeddings_for_content,
+            single_embedding_for_text=self._execute_single_embedding_for_text,
+        )
+        self._cache = None
+        if cache_path or memory_cache_size > 0:
+            self._cache = EmbeddingCache(cache_path, memory_cache_size)
 
-    def _execute_embeddings_for_content(self, content: List[str]) -> List[List[float]]:
+    def _cache_key(self, text: str) -> bytes:
+        """Build the embedding cache key for a text."""
+        return EmbeddingCache.make_key(self._model, self._embedding_dimensions, text)
+
+    async def _execute_embeddings_for_content(
+        self, client: genai.Client, content: List[str]
+    ) -> np.ndarray:
         """Execute embedding operation for multiple content items."""
-        result = self._client.models.embed_content(
+        result = await client.aio.models.embed_content(
             model=self._model,
-            contents=content,
+            # A single text is sent as-is, without wrapping it in a list
+            contents=content[0] if len(content) == 1 else content,
             config={"output_dimensionality": self._embedding_dimensions},
         )
-        embeddings = []
-        for embedding in result.embeddings:
-            embeddings.append(embedding.values)
-        return embeddings
+        return np.asarray(
+            [embedding.values for embedding in result.embeddings], dtype=np.float32
+        )
 
-    def _execute_single_embedding_for_text(self, text: str) -> List[float]:
+    async def _execute_single_embedding_for_text(
+        self, client: genai.Client, text: str
+    ) -> np.ndarray:
         """Execute embedding operation for single text."""
-        result = self._client.models.embed_content(
+        result = await client.aio.models.embed_content(
             model=self._model,
             contents=text,
             config={"output_dimensionality": self._embedding_dimensions},
         )
-        return result.embeddings[0].values
+        return np.asarray(result.embeddings[0].values, dtype=np.float32)
+
+    async def _embed_in_batches(self, content: List[str]) -> np.ndarray:
+        """Embed content with one API request per batch of texts.
 
-    async def embed_content(self, content: Union[str, List[str]]) -> List[List[float]]:
+        Requests go through the SDK's async client, with up to
+        max_concurrent_batches batches in flight; each batch retries and
+        switches API keys independently. Repeated texts are only sent once.
+        """
+        unique_texts = list(dict.fromkeys(content))
+        if len(unique_texts) < len(content):
+            positions = {text: i for i, text in enumerate(unique_texts)}
+            embeddings = await self._embed_in_batches(unique_texts)
+            return embeddings[[positions[text] for text in content]]
+
+        batches = list(_partition(content))
+        if len(batches) <= 1:
+            if not batches:
+                return np.empty((0, self._embedding_dimensions), dtype=np.float32)
+            return await self._execute_with_retry_and_token_switching(
+                "embeddings_for_content", batches[0]
+            )
+
+        semaphore = asyncio.Semaphore(self._max_concurrent_batches)
+
+        async def embed_batch(batch: List[str]) -> np.ndarray:
+            async with semaphore:
+                # Small jitter so concurrent batches don't hit the API in lockstep
+                await asyncio.sleep(random.random() * 0.05)
+                return await self._execute_with_retry_and_token_switching(
+                    "embeddings_for_content", batch
+                )
+
+        results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+        return np.concatenate(results)
+
+    async def embed_content(self, content: Union[str, List[str]]) -> np.ndarray:
         """
         Generate embeddings for the given content.
 
@@ -63,16 +159,40 @@ class GoogleGenAIEmbeddingService(GoogleGenAIBaseService, EmbeddingServiceInterf
             content: Single text string or list of text strings to embed
 
         Returns:
-            List of embedding vectors (list of floats)
+            float32 array of shape (len(content), dimensions)
         """
         if isinstance(content, str):
             content = [content]
+        if not content:
+            return np.empty((0, self._embedding_dimensions), dtype=np.float32)
+
+        if self._cache is None:
+            return await self._embed_in_batches(content)
+
+        keys = [self._cache_key(text) for text in content]
+        cached = await self._cache.get_many(keys)
+        misses = [i for i, key in enumerate(keys) if key not in cached]
+        if not misses:
+            # Fully cached: no API call and no scatter into a new array
+            return np.stack([cached[key] for key in keys])
+
+        new_embeddings = await self._embed_in_batches([content[i] for i in misses])
+        await self._cache.set_many(
+            {keys[i]: embedding for i, embedding in zip(misses, new_embeddings)}
+        )
+        if len(misses) == len(keys):
+            return new_embeddings
 
-        return self._execute_with_retry_and_token_switching(
-            "embeddings_for_content", content
+        embeddings = np.empty(
+            (len(keys), new_embeddings.shape[1]), dtype=np.float32
         )
+        embeddings[misses] = new_embeddings
+        for i, key in enumerate(keys):
+            if key in cached:
+                embeddings[i] = cached[key]
+        return embeddings
 
-    async def embed_single(self, text: str) -> List[float]:
+    async def embed_single(self, text: str) -> np.ndarray:
         """
         Generate embedding for a single text string.
 
@@ -80,11 +200,30 @@ class GoogleGenAIEmbeddingService(GoogleGenAIBaseService, EmbeddingServiceInterf
             text: Text string to embed
 
         Returns:
-            Embedding vector as list of floats
+            Embedding vector as a float32 array
         """
-        return self._execute_with_retry_and_token_switching(
+        key = self._cache_key(text)
+        if self._cache is not None:
+            embedding = await self._cache.get(key)
+            if embedding is not None:
+                return embedding
+
+        # Concurrent requests for the same text share a single API call
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._embed_single_uncached(text, key))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _embed_single_uncached(self, text: str, key: bytes) -> np.ndarray:
+        """Embed a single text through the API and cache the result."""
+        embedding = await self._execute_with_retry_and_token_switching(
             "single_embedding_for_text", text
         )
+        if self._cache is not None:
+            await self._cache.set_many({key: embedding})
+        return embedding
 
     def get_embedding_dimensions(self) -> int:
         """
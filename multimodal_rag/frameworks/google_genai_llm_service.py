@@ -1,15 +1,92 @@
 """Google GenAI LLM service implementation."""
 
+import asyncio
+import copy
 import json
-from typing import Optional, Dict, Any, Union, List
+import operator
+import re
+from typing import Optional, Dict, Any, Union, List, Tuple
+from google import genai
 from google.genai import types
 
+try:
+    # orjson comes with the elasticsearch[orjson] extra
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # jsonschema comes with docling-core
+    from jsonschema import Draft202012Validator
+    from jsonschema.exceptions import best_match
+except ImportError:
+    Draft202012Validator = None
+
+from multimodal_rag.usecases.interfaces.embedding_service import (
+    EmbeddingServiceInterface,
+)
 from multimodal_rag.usecases.interfaces.llm_service import LLMServiceInterface
 from multimodal_rag.frameworks.google_genai_base_service import GoogleGenAIBaseService
+from multimodal_rag.frameworks.response_cache import ResponseCache
+from multimodal_rag.frameworks.semantic_cache import SemanticCache
 from multimodal_rag.frameworks.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Contents of the first Markdown code fence, with or without a json tag
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+# Upper bound on the number of response schemas or tool sets whose derived
+# config or validator is cached
+_MAX_CACHED_CONFIGS = 64
+
+
+# Rough characters per token, used to estimate prompt size without an API call
+_CHARS_PER_TOKEN = 4
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _is_deterministic(kwargs: Dict[str, Any]) -> bool:
+    """Whether a request asks for repeatable output.
+
+    Gemini samples with a temperature of 1.0 unless told otherwise, so only
+    requests with temperature 0 or a fixed seed, given directly or in their
+    generation config, get the same answer when sent again.
+    """
+    config = kwargs.get("config")
+    if config is None:
+        config = {}
+    elif not isinstance(config, dict):
+        config = {name: getattr(config, name, None) for name in ("temperature", "seed")}
+    # Values given directly take precedence, as in _merge_config
+    temperature = kwargs.get("temperature")
+    if temperature is None:
+        temperature = config.get("temperature")
+    seed = kwargs.get("seed")
+    if seed is None:
+        seed = config.get("seed")
+    return seed is not None or temperature == 0
+
+
+def _merge_config(
+    config: Union[types.GenerateContentConfig, Dict[str, Any], None], **fields: Any
+) -> types.GenerateContentConfig:
+    """Return a caller's generation config with the given fields set on top.
+
+    The config may be a GenerateContentConfig or its dict form. Fields that
+    are None leave the caller's value in place.
+    """
+    merged = (
+        types.GenerateContentConfig.model_validate(config).model_dump(exclude_none=True)
+        if config is not None
+        else {}
+    )
+    merged.update((name, value) for name, value in fields.items() if value is not None)
+    return types.GenerateContentConfig(**merged)
+
 
 class GoogleGenAILLMService(GoogleGenAIBaseService, LLMServiceInterface):
     """Google GenAI implementation of the LLM service."""
@@ -19,6 +96,13 @@ class GoogleGenAILLMService(GoogleGenAIBaseService, LLMServiceInterface):
         api_keys: Union[str, List[str]],
         default_model: str = "gemini-2.5-flash",
         max_retries: int = 3,
+        requests_per_minute: Optional[int] = None,
+        response_cache_path: Optional[str] = None,
+        response_cache_size: int = 0,
+        embedding_service: Optional[EmbeddingServiceInterface] = None,
+        semantic_cache_threshold: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        max_input_tokens: Optional[int] = None,
     ):
         """
         Initialize the Google GenAI LLM service.
@@ -27,101 +111,309 @@ class GoogleGenAILLMService(GoogleGenAIBaseService, LLMServiceInterface):
             api_keys: Single API key string or list of API keys for token switching
             default_model: Default model name for content generation
             max_retries: Maximum number of retries for failed requests
+            requests_per_minute: Optional per-key request limit enforced on the
+                client side before calling the API
+            response_cache_path: Optional SQLite file for caching responses
+                across runs
+            response_cache_size: Number of responses kept in an in-process LRU
+                (0 disables it)
+            embedding_service: Embedding service used by the semantic cache
+            semantic_cache_threshold: Cosine similarity above which a prompt
+                reuses the response of a similar earlier prompt (None disables)
+            max_output_tokens: Optional cap on the tokens generated for
+                structured responses
+            max_input_tokens: Optional estimated token budget for prompts;
+                longer prompts keep their head and tail and drop the middle
         """
-        super().__init__(api_keys, max_retries)
+        super().__init__(api_keys, max_retries, requests_per_minute)
         self._default_model = default_model
+        self._max_output_tokens = max_output_tokens
+        self._max_input_tokens = max_input_tokens
+        self._operations.update(
+            content_generation=self._execute_content_generation,
+            structured_content_generation=self._execute_structured_content_generation,
+            content_generation_with_tools=self._execute_content_generation_with_tools,
+        )
 
-        self._available_models = [
+        # Exact-match cache of text and structured responses, off by default
+        self._response_cache = None
+        if response_cache_path or response_cache_size:
+            self._response_cache = ResponseCache(
+                response_cache_path, response_cache_size or 0
+            )
+        # Matches paraphrased prompts; needs an embedding service
+        self._embedding_service = embedding_service
+        self._semantic_cache = None
+        if embedding_service is not None and semantic_cache_threshold:
+            self._semantic_cache = SemanticCache(semantic_cache_threshold)
+
+        # Identical requests in flight at the same time share one API call
+        self._in_flight: Dict[bytes, "asyncio.Future[Any]"] = {}
+        self._structured_configs: Dict[
+            Tuple[int, Optional[int], Optional[float], Optional[int]],
+            Tuple[Optional[Dict[str, Any]], types.GenerateContentConfig],
+        ] = {}
+        self._schema_validators: Dict[int, Tuple[Dict[str, Any], Any]] = {}
+        self._tool_configs: Dict[
+            Tuple[int, ...],
+            Tuple[Tuple[Dict[str, Any], ...], types.GenerateContentConfig],
+        ] = {}
+
+        self._available_models = (
             "gemini-2.5-flash",
             "gemini-1.5-pro",
             "gemini-1.5-flash",
-        ]
+        )
 
-    def _execute_content_generation(
-        self, model_name: str, prompt: str, **kwargs
+    async def _execute_content_generation(
+        self,
+        client: genai.Client,
+        model_name: str,
+        prompt: str,
+        temperature: Optional[float] = None,
+        seed: Optional[int] = None,
+        **kwargs,
     ) -> str:
-        """Execute content generation operation."""
-        response = self._client.models.generate_content(
+        """Execute content generation operation.
+
+        The SDK only takes sampling settings in the generation config, so
+        temperature and seed given directly are moved there.
+        """
+        if temperature is not None or seed is not None:
+            kwargs["config"] = _merge_config(
+                kwargs.get("config"), temperature=temperature, seed=seed
+            )
+        response = await client.aio.models.generate_content(
             model=model_name, contents=prompt, **kwargs
         )
         return response.text
 
-    def _execute_structured_content_generation(
-        self, model_name: str, structured_prompt: str, **kwargs
+    async def _execute_structured_content_generation(
+        self,
+        client: genai.Client,
+        model_name: str,
+        prompt: str,
+        response_schema: Optional[Dict[str, Any]] = None,
+        max_output_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        seed: Optional[int] = None,
+        **kwargs,
     ) -> Dict[str, Any]:
-        """Execute structured content generation operation."""
-        response = self._client.models.generate_content(
-            model=model_name, contents=structured_prompt, **kwargs
+        """Execute structured content generation operation.
+
+        A generation config given by the caller is kept, with the JSON mode
+        settings set on top of it.
+        """
+        if max_output_tokens is None:
+            max_output_tokens = self._max_output_tokens
+        config = self._structured_config(
+            response_schema, max_output_tokens, temperature, seed
+        )
+        caller_config = kwargs.pop("config", None)
+        if caller_config is not None:
+            config = _merge_config(
+                caller_config, **config.model_dump(exclude_none=True)
+            )
+        response = await client.aio.models.generate_content(
+            model=model_name, contents=prompt, config=config, **kwargs
         )
 
         generated_text = response.text.strip()
+        # JSON mode returns bare JSON; fences are only stripped as a fallback
+        if generated_text[:1] not in ("{", "["):
+            fence = _JSON_FENCE_RE.search(generated_text)
+            if fence:
+                generated_text = fence.group(1).strip()
+
+        # Prose can't be JSON, so skip the parse and its exception entirely
+        if not generated_text or generated_text[0] not in "{[":
+            logger.warning("Response was not valid JSON, returning as text field")
+            return {"text": generated_text}
 
         try:
-            if "```json" in generated_text:
-                json_start = generated_text.find("```json") + 7
-                json_end = generated_text.find("```", json_start)
-                generated_text = generated_text[json_start:json_end].strip()
-            elif "```" in generated_text:
-                json_start = generated_text.find("```") + 3
-                json_end = generated_text.rfind("```")
-                generated_text = generated_text[json_start:json_end].strip()
-
-            structured_response = json.loads(generated_text)
-            return structured_response
+            structured_response = _loads(generated_text)
         except json.JSONDecodeError:
             logger.warning("Response was not valid JSON, returning as text field")
             return {"text": generated_text}
 
-    def _execute_content_generation_with_tools(
+        if response_schema:
+            self._check_schema(structured_response, response_schema)
+        return structured_response
+
+    async def _execute_content_generation_with_tools(
         self,
+        client: genai.Client,
         model_name: str,
         prompt: str,
         tools: Optional[List[Dict[str, Any]]] = None,
+        temperature: Optional[float] = None,
+        seed: Optional[int] = None,
         **kwargs,
     ) -> Dict[str, Any]:
         """Execute content generation with tools operation."""
-        config = None
-        if tools:
-            # Convert tools to Google GenAI format
-            function_declarations = []
-            for tool in tools:
-                if "function" in tool:
-                    function_declarations.append(tool["function"])
-                else:
-                    function_declarations.append(tool)
-
-            tools_config = types.Tool(function_declarations=function_declarations)
-            config = types.GenerateContentConfig(tools=[tools_config])
-
-        response = self._client.models.generate_content(
+        config = kwargs.pop("config", None)
+        if config is None and temperature is None and seed is None:
+            config = self._tool_config(tools) if tools else None
+        else:
+            config = _merge_config(
+                config,
+                tools=self._tool_config(tools).tools if tools else None,
+                temperature=temperature,
+                seed=seed,
+            )
+        response = await client.aio.models.generate_content(
             model=model_name, contents=prompt, config=config, **kwargs
         )
 
-        # Parse the response
-        result = {
-            "text": response.text if response.text else "",
-            "function_calls": [],
-            "has_function_call": False,
+        # Collect text and function calls in one pass over the parts, instead
+        # of letting response.text join the text parts separately
+        candidate = response.candidates[0] if response.candidates else None
+        parts = (
+            candidate.content.parts
+            if candidate and candidate.content and candidate.content.parts
+            else ()
+        )
+        text_chunks = []
+        function_calls = []
+        for part in parts:
+            if part.function_call:
+                function_call = part.function_call
+                function_calls.append(
+                    {
+                        "name": function_call.name,
+                        # The SDK already parses args into a dict owned by this
+                        # response, so it is handed over without a copy
+                        "args": function_call.args or {},
+                    }
+                )
+            elif part.text and not part.thought:
+                text_chunks.append(part.text)
+
+        return {
+            "text": "".join(text_chunks),
+            "function_calls": function_calls,
+            "has_function_call": bool(function_calls),
         }
 
-        # Check for function calls
-        if response.candidates and len(response.candidates) > 0:
-            candidate = response.candidates[0]
-            if candidate.content and candidate.content.parts:
-                for part in candidate.content.parts:
-                    if hasattr(part, "function_call") and part.function_call:
-                        function_call = part.function_call
-                        result["function_calls"].append(
-                            {
-                                "name": function_call.name,
-                                "args": dict(function_call.args)
-                                if function_call.args
-                                else {},
-                            }
-                        )
-                        result["has_function_call"] = True
-
-        return result
+    def _tool_config(
+        self, tools: List[Dict[str, Any]]
+    ) -> types.GenerateContentConfig:
+        """Return the generation config declaring the given tools.
+
+        Configs are cached per combination of tool definition objects, which
+        are kept referenced so that their ids cannot be reused, so callers
+        passing the same definitions skip the conversion on every request.
+        """
+        cache_key = tuple(map(id, tools))
+        entry = self._tool_configs.get(cache_key)
+        if entry is not None and all(map(operator.is_, entry[0], tools)):
+            return entry[1]
+
+        # Convert tools to Google GenAI format
+        function_declarations = [
+            tool["function"] if "function" in tool else tool for tool in tools
+        ]
+        config = types.GenerateContentConfig(
+            tools=[types.Tool(function_declarations=function_declarations)]
+        )
+        if len(self._tool_configs) >= _MAX_CACHED_CONFIGS:
+            self._tool_configs.clear()
+        self._tool_configs[cache_key] = (tuple(tools), config)
+        return config
+
+    def _fit_prompt(self, prompt: str) -> str:
+        """Shorten a prompt that exceeds max_input_tokens.
+
+        The size is estimated from the character count. The beginning and end
+        of the prompt hold the instructions and the question in templated
+        prompts, so those are kept and the middle is replaced by a marker.
+        """
+        if self._max_input_tokens is None:
+            return prompt
+        max_chars = self._max_input_tokens * _CHARS_PER_TOKEN
+        if len(prompt) <= max_chars:
+            return prompt
+
+        dropped_tokens = (len(prompt) - max_chars) // _CHARS_PER_TOKEN
+        marker = f"\n...[truncated about {dropped_tokens} tokens]...\n"
+        keep = max(max_chars - len(marker), 0)
+        head = keep - keep // 2
+        logger.info(
+            f"Prompt of about {len(prompt) // _CHARS_PER_TOKEN} tokens truncated "
+            f"to {self._max_input_tokens} ({max_chars / len(prompt):.0%})"
+        )
+        return prompt[:head] + marker + prompt[len(prompt) - keep // 2 :]
+
+    async def _embed_prompt(self, prompt: str) -> Optional[Any]:
+        """Embed a prompt for the semantic cache, or None if embedding fails."""
+        try:
+            return await self._embedding_service.embed_single(prompt)
+        except Exception as e:
+            logger.warning(f"Failed to embed prompt for the semantic cache: {e}")
+            return None
+
+    async def _cached_operation(
+        self, operation_name: str, model_name: str, prompt: str, **kwargs: Any
+    ) -> Any:
+        """Run a generation operation, serving repeated requests from the caches.
+
+        The exact-match cache is checked first. Concurrent identical requests
+        are then coalesced into a single call, which also consults the
+        semantic cache for prompts similar to earlier ones with the same model
+        and parameters. Sampled requests, without temperature 0 or a seed,
+        bypass all of this, since their answer is meant to vary.
+        """
+        if not _is_deterministic(kwargs):
+            return await self._execute_with_retry_and_token_switching(
+                operation_name, model_name, prompt, **kwargs
+            )
+
+        key = ResponseCache.make_key(operation_name, model_name, prompt, kwargs)
+        if self._response_cache is not None:
+            response = await self._response_cache.get(key)
+            if response is not None:
+                return response
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            # Give each waiter its own copy, like the response cache does
+            return copy.deepcopy(await asyncio.shield(task))
+
+        task = asyncio.ensure_future(
+            self._uncached_operation(
+                key, operation_name, model_name, prompt, **kwargs
+            )
+        )
+        self._in_flight[key] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _uncached_operation(
+        self,
+        key: bytes,
+        operation_name: str,
+        model_name: str,
+        prompt: str,
+        **kwargs: Any,
+    ) -> Any:
+        """Run a generation operation through the semantic cache and the API."""
+        prompt_vector = None
+        if self._semantic_cache is not None:
+            scope = ResponseCache.make_key(operation_name, model_name, kwargs)
+            prompt_vector = await self._embed_prompt(prompt)
+            if prompt_vector is not None:
+                response = self._semantic_cache.get(prompt_vector, scope)
+                if response is not None:
+                    return response
+
+        response = await self._execute_with_retry_and_token_switching(
+            operation_name, model_name, prompt, **kwargs
+        )
+        if self._response_cache is not None:
+            await self._response_cache.set(key, response)
+        if prompt_vector is not None:
+            self._semantic_cache.set(prompt_vector, scope, response)
+        return response
 
     async def generate_content(
         self, prompt: str, model: Optional[str] = None, **kwargs: Any
@@ -139,10 +431,62 @@ class GoogleGenAILLMService(GoogleGenAIBaseService, LLMServiceInterface):
         """
         model_name = model or self._default_model
 
-        return self._execute_with_retry_and_token_switching(
-            "content_generation", model_name, prompt, **kwargs
+        return await self._cached_operation(
+            "content_generation", model_name, self._fit_prompt(prompt), **kwargs
         )
 
+    def _structured_config(
+        self,
+        response_schema: Optional[Dict[str, Any]],
+        max_output_tokens: Optional[int],
+        temperature: Optional[float] = None,
+        seed: Optional[int] = None,
+    ) -> types.GenerateContentConfig:
+        """Return the generation config requesting JSON that follows the schema.
+
+        Configs are cached per schema object, which is kept referenced so
+        that its id cannot be reused by another object.
+        """
+        cache_key = (id(response_schema), max_output_tokens, temperature, seed)
+        entry = self._structured_configs.get(cache_key)
+        if entry is not None and entry[0] is response_schema:
+            return entry[1]
+
+        config = types.GenerateContentConfig(
+            response_mime_type="application/json",
+            response_json_schema=response_schema,
+            max_output_tokens=max_output_tokens,
+            temperature=temperature,
+            seed=seed,
+        )
+        if len(self._structured_configs) >= _MAX_CACHED_CONFIGS:
+            self._structured_configs.clear()
+        self._structured_configs[cache_key] = (response_schema, config)
+        return config
+
+    def _check_schema(self, value: Any, response_schema: Dict[str, Any]) -> None:
+        """Log a warning if a structured response does not match its schema.
+
+        Validators are compiled once per schema object and reused; the check
+        is skipped when jsonschema is not installed.
+        """
+        if Draft202012Validator is None:
+            return
+
+        entry = self._schema_validators.get(id(response_schema))
+        if entry is None or entry[0] is not response_schema:
+            entry = (response_schema, Draft202012Validator(response_schema))
+            if len(self._schema_validators) >= _MAX_CACHED_CONFIGS:
+                self._schema_validators.clear()
+            self._schema_validators[id(response_schema)] = entry
+
+        validator = entry[1]
+        if not validator.is_valid(value):
+            error = best_match(validator.iter_errors(value))
+            logger.warning(
+                f"Structured response does not match the schema: {error.message}"
+            )
+
     async def generate_structured_content(
         self,
         prompt: str,
@@ -163,19 +507,14 @@ class GoogleGenAILLMService(GoogleGenAIBaseService, LLMServiceInterface):
             Structured response as dictionary
         """
         model_name = model or self._default_model
-
-        structured_prompt = prompt
         if response_schema:
-            schema_str = json.dumps(response_schema, indent=2)
-            structured_prompt = f"""{prompt}
-
-Ensure to respond with a JSON object that follows this schema:
-{schema_str}
-
-Ensure your response is valid JSON and follows the schema exactly."""
+            kwargs["response_schema"] = response_schema
 
-        return self._execute_with_retry_and_token_switching(
-            "structured_content_generation", model_name, structured_prompt, **kwargs
+        return await self._cached_operation(
+            "structured_content_generation",
+            model_name,
+            self._fit_prompt(prompt),
+            **kwargs,
         )
 
     async def generate_content_with_tools(
@@ -199,15 +538,19 @@ Ensure your response is valid JSON and follows the schema exactly."""
         """
         model_name = model or self._default_model
 
-        return self._execute_with_retry_and_token_switching(
-            "content_generation_with_tools", model_name, prompt, tools, **kwargs
+        return await self._execute_with_retry_and_token_switching(
+            "content_generation_with_tools",
+            model_name,
+            self._fit_prompt(prompt),
+            tools,
+            **kwargs,
         )
 
-    def get_available_models(self) -> list[str]:
+    def get_available_models(self) -> tuple[str, ...]:
         """
-        Get list of available models.
+        Get the available models.
 
         Returns:
-            List of available model names
+            Tuple of available model names, shared between calls
         """
-        return self._available_models.copy()
+        return self._available_models
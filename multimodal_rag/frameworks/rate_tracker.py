@@ -0,0 +1,81 @@
+"""Client-side request rate tracking for API keys."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, List
+
+from multimodal_rag.frameworks.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateTracker:
+    """Sliding-window request limiter with one window per API key.
+
+    Keeps the send times of the most recent requests of each key and makes
+    callers wait before a request would exceed the per-key limit, so that the
+    API does not have to reject it with a rate limit error first.
+    """
+
+    def __init__(
+        self, num_keys: int, requests_per_minute: int, window_seconds: float = 60.0
+    ):
+        """
+        Initialize the rate tracker.
+
+        Args:
+            num_keys: Number of API keys to track
+            requests_per_minute: Maximum number of requests per key in one window
+            window_seconds: Length of the sliding window in seconds
+        """
+        self._limit = requests_per_minute
+        self._window = window_seconds
+        self._lock = threading.Lock()
+        self._requests: List[Deque[float]] = [
+            deque(maxlen=requests_per_minute) for _ in range(num_keys)
+        ]
+
+    def _reserve(self, key_index: int) -> float:
+        """
+        Record a request if the key has room in its window.
+
+        Args:
+            key_index: Index of the API key about to be used
+
+        Returns:
+            0 if the request was recorded, otherwise seconds until the window
+            has room again
+        """
+        requests = self._requests[key_index]
+        with self._lock:
+            now = time.monotonic()
+            while requests and now - requests[0] >= self._window:
+                requests.popleft()
+            if len(requests) < self._limit:
+                requests.append(now)
+                return 0.0
+            wait = requests[0] + self._window - now
+
+        logger.debug(
+            "API key index %d reached %d requests per window, waiting %.2fs",
+            key_index,
+            self._limit,
+            wait,
+        )
+        return wait
+
+    async def aacquire(self, key_index: int) -> None:
+        """
+        Wait until the key has room in its window, then record a request.
+
+        The wait happens on the event loop, so other tasks keep running.
+
+        Args:
+            key_index: Index of the API key about to be used
+        """
+        wait = self._reserve(key_index)
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._reserve(key_index)
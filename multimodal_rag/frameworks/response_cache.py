@@ -0,0 +1,125 @@
+"""Cache for LLM responses keyed by a hash of the request."""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from multimodal_rag.frameworks.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResponseCache:
+    """Two-tier exact-match store of LLM responses.
+
+    Responses are stored as JSON text, both in an in-process LRU and in an
+    optional SQLite file, so every hit returns a fresh copy that callers may
+    modify. Disk reads and writes run in a worker thread so they don't block
+    the event loop. Cache failures are logged and treated as misses.
+    """
+
+    def __init__(self, path: Optional[str] = None, memory_size: int = 1024):
+        """
+        Initialize the response cache.
+
+        Args:
+            path: Optional path of the SQLite database file
+            memory_size: Maximum number of responses kept in memory (0 disables)
+        """
+        self._lock = threading.Lock()
+        # Separate lock for the connection, so that memory lookups on the
+        # event loop never wait for a disk query in a worker thread
+        self._db_lock = threading.Lock()
+        self._memory: "OrderedDict[bytes, str]" = OrderedDict()
+        self._memory_size = memory_size
+
+        self._connection = None
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key BLOB PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._connection.commit()
+
+    @staticmethod
+    def make_key(*parts: Any) -> bytes:
+        """Build the cache key for a request from its JSON-serializable parts."""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+    async def get(self, key: bytes) -> Optional[Any]:
+        """Get a cached response, or None if it is not cached."""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+
+        if value is None and self._connection is not None:
+            value = await asyncio.to_thread(self._get_from_disk, key)
+            if value is not None:
+                self._remember(key, value)
+
+        return json.loads(value) if value is not None else None
+
+    def _get_from_disk(self, key: bytes) -> Optional[str]:
+        """Look up a serialized response in the SQLite store."""
+        try:
+            with self._db_lock:
+                row = self._connection.execute(
+                    "SELECT value FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache lookup failed: {e}")
+            return None
+        return row[0] if row is not None else None
+
+    def _remember(self, key: bytes, value: str) -> None:
+        """Add a response to the in-memory LRU, evicting the oldest ones."""
+        if self._memory_size <= 0:
+            return
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_size:
+                self._memory.popitem(last=False)
+
+    async def set(self, key: bytes, response: Any) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            key: Cache key of the request
+            response: JSON-serializable response
+        """
+        value = json.dumps(response)
+        self._remember(key, value)
+        if self._connection is None:
+            return
+        await asyncio.to_thread(self._write_to_disk, key, value)
+
+    def _write_to_disk(self, key: bytes, value: str) -> None:
+        """Store a serialized response in the SQLite store."""
+        try:
+            with self._db_lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+                    (key, value),
+                )
+                self._connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    def close(self) -> None:
+        """Close the underlying database connection, if any."""
+        with self._db_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
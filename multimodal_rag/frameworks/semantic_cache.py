@@ -0,0 +1,109 @@
+"""Similarity-based cache for LLM responses to near-duplicate prompts."""
+
+import json
+import threading
+from typing import Any, List, Optional
+
+import numpy as np
+
+from multimodal_rag.frameworks.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class SemanticCache:
+    """In-memory cache that matches prompts by embedding cosine similarity.
+
+    Prompt embeddings are kept L2-normalized in one matrix, so a lookup is a
+    single matrix-vector product (an exact inner-product search). Entries are
+    only matched within the same scope, e.g. the same operation, model and
+    generation parameters. When full, the oldest entries are overwritten.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 1024):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a prompt to match
+            max_entries: Maximum number of cached responses
+        """
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._vectors: Optional[np.ndarray] = None
+        self._scopes: List[bytes] = []
+        self._responses: List[str] = []
+        self._next = 0
+
+    @staticmethod
+    def _normalize(vector: Any) -> Optional[np.ndarray]:
+        """Return the vector scaled to unit length, or None for a zero vector."""
+        vector = np.asarray(vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def get(self, vector: Any, scope: bytes) -> Optional[Any]:
+        """
+        Get the response of the most similar cached prompt in the same scope.
+
+        Args:
+            vector: Embedding of the prompt
+            scope: Key of the request parameters that must match exactly
+
+        Returns:
+            A copy of the cached response, or None if no prompt is similar enough
+        """
+        query = self._normalize(vector)
+        if query is None:
+            return None
+
+        with self._lock:
+            count = len(self._scopes)
+            if not count or self._vectors.shape[1] != query.shape[0]:
+                return None
+            similarities = self._vectors[:count] @ query
+            in_scope = np.fromiter(
+                (s == scope for s in self._scopes), dtype=bool, count=count
+            )
+            similarities[~in_scope] = -1.0
+            best = int(np.argmax(similarities))
+            if similarities[best] < self._threshold:
+                return None
+            response = self._responses[best]
+
+        logger.debug(f"Semantic cache hit with similarity {similarities[best]:.3f}")
+        return json.loads(response)
+
+    def set(self, vector: Any, scope: bytes, response: Any) -> None:
+        """
+        Store the response of a prompt.
+
+        Args:
+            vector: Embedding of the prompt
+            scope: Key of the request parameters that must match exactly
+            response: JSON-serializable response
+        """
+        normalized = self._normalize(vector)
+        if normalized is None or self._max_entries <= 0:
+            return
+        value = json.dumps(response)
+
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != normalized.shape[0]:
+                self._vectors = np.empty(
+                    (self._max_entries, normalized.shape[0]), dtype=np.float32
+                )
+                self._scopes = []
+                self._responses = []
+                self._next = 0
+
+            index = self._next
+            self._vectors[index] = normalized
+            if index == len(self._scopes):
+                self._scopes.append(scope)
+                self._responses.append(value)
+            else:
+                self._scopes[index] = scope
+                self._responses[index] = value
+            self._next = (index + 1) % self._max_entries
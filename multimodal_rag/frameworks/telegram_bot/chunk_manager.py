@@ -1,18 +1,70 @@
 """Document chunk management for Telegram bot."""
 
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
+from multimodal_rag.entities.document import _VALUE_OBJECT
 from multimodal_rag.frameworks.logging_config import get_logger
 from multimodal_rag.frameworks.telegram_bot.utils import escape_markdown
 
 logger = get_logger(__name__)
 
 
+@dataclass(**_VALUE_OBJECT)
+class ChunkRecord:
+    """Chunk kept for a user so it can be shown on request."""
+
+    text: str
+    document_id: str
+    chunk_id: str
+
+
 class ChunkManager:
     """Manages document chunks for user interactions."""
 
-    def __init__(self):
-        """Initialize chunk manager."""
-        self._user_chunks: Dict[str, Dict[str, Any]] = {}
+    def __init__(
+        self, max_users: int = 10_000, ttl_seconds: Optional[float] = 1800.0
+    ):
+        """Initialize chunk manager.
+
+        Args:
+            max_users: Maximum number of users whose chunks are kept; the
+                least recently active users are dropped first
+            ttl_seconds: Inactivity after which a user's chunks are dropped
+                (None keeps them until evicted by max_users)
+        """
+        # Ordered from least to most recently active user
+        self._user_chunks: "OrderedDict[str, Dict[str, ChunkRecord]]" = OrderedDict()
+        self._last_active: Dict[str, float] = {}
+        self._max_users = max_users
+        self._ttl_seconds = ttl_seconds
+
+    def _is_expired(self, user_id: str, now: float) -> bool:
+        """Whether a user's chunks have outlived the inactivity TTL."""
+        return (
+            self._ttl_seconds is not None
+            and now - self._last_active[user_id] > self._ttl_seconds
+        )
+
+    def _touch(self, user_id: str, now: float) -> None:
+        """Mark a user as the most recently active one."""
+        self._user_chunks.move_to_end(user_id)
+        self._last_active[user_id] = now
+
+    def _evict(self, now: float) -> None:
+        """Drop users over the max_users limit or past the TTL.
+
+        Users are ordered by activity, so only the oldest ones are examined.
+        """
+        while self._user_chunks:
+            oldest = next(iter(self._user_chunks))
+            if len(self._user_chunks) <= self._max_users and not self._is_expired(
+                oldest, now
+            ):
+                break
+            del self._user_chunks[oldest]
+            del self._last_active[oldest]
 
     def store_chunks(
         self, user_id: str, chunk_ids: List[str], retrieved_chunks: List[Any]
@@ -27,22 +79,20 @@ class ChunkManager:
         if not chunk_ids or not retrieved_chunks:
             return
 
-        if user_id not in self._user_chunks:
-            self._user_chunks[user_id] = {}
+        now = time.monotonic()
+        user_chunks = self._user_chunks.setdefault(user_id, {})
+        self._touch(user_id, now)
+        self._evict(now)
 
         # Map chunk IDs to chunk data for this user
         for chunk_id, chunk in zip(chunk_ids, retrieved_chunks):
-            self._user_chunks[user_id][chunk_id] = {
-                "text": chunk.text,
-                "document_id": chunk.document_id,
-                "chunk_id": chunk_id,
-            }
+            user_chunks[chunk_id] = ChunkRecord(chunk.text, chunk.document_id, chunk_id)
 
         logger.debug(
             f"Stored {len(chunk_ids)} chunks for user {user_id}: {chunk_ids}"
         )
 
-    def get_chunk(self, user_id: str, chunk_id: str) -> Optional[Dict[str, Any]]:
+    def get_chunk(self, user_id: str, chunk_id: str) -> Optional[ChunkRecord]:
         """Get chunk data for a user.
 
         Args:
@@ -50,9 +100,16 @@ class ChunkManager:
             chunk_id: Chunk identifier
 
         Returns:
-            Chunk data dictionary or None if not found
+            Chunk record or None if not found
         """
-        user_chunks = self._user_chunks.get(user_id, {})
+        user_chunks = self._user_chunks.get(user_id)
+        if user_chunks is None:
+            return None
+        now = time.monotonic()
+        if self._is_expired(user_id, now):
+            self.clear_user_chunks(user_id)
+            return None
+        self._touch(user_id, now)
         return user_chunks.get(chunk_id)
 
     def clear_user_chunks(self, user_id: str) -> bool:
@@ -66,6 +123,7 @@ class ChunkManager:
         """
         if user_id in self._user_chunks:
             del self._user_chunks[user_id]
+            del self._last_active[user_id]
             logger.info(f"Cleared chunks for user {user_id}")
             return True
         return False
@@ -83,24 +141,27 @@ class ChunkManager:
         return list(user_chunks.keys())
 
     def format_chunk_content(
-        self, chunk_data: Dict[str, Any], max_length: int = 3000
+        self, chunk_data: ChunkRecord, max_length: int = 3000
     ) -> str:
         """Format chunk content for display.
 
         Args:
-            chunk_data: Chunk data dictionary
+            chunk_data: Chunk record
             max_length: Maximum length for chunk text
 
         Returns:
             Formatted chunk content
         """
-        chunk_text = chunk_data.get("text", "No content available")
-        document_id = chunk_data.get("document_id", "Unknown")
-        chunk_id = chunk_data.get("chunk_id", "Unknown")
+        chunk_text = chunk_data.text or "No content available"
+        document_id = chunk_data.document_id or "Unknown"
+        chunk_id = chunk_data.chunk_id or "Unknown"
 
-        # Truncate if too long
+        # Truncate if too long; the ellipsis is added in the final format
+        # rather than by concatenating onto the cut text
+        ellipsis = ""
         if len(chunk_text) > max_length:
-            chunk_text = chunk_text[:max_length] + "..."
+            chunk_text = chunk_text[:max_length]
+            ellipsis = "..."
 
         # Escape Markdown special characters in the content
         chunk_text = escape_markdown(chunk_text)
@@ -110,5 +171,5 @@ class ChunkManager:
         return (
             f"📄 *Document Chunk: {chunk_id}*\n\n"
             f"📋 *Document ID:* `{document_id}`\n\n"
-            f"*Content:*\n{chunk_text}"
+            f"*Content:*\n{chunk_text}{ellipsis}"
         )
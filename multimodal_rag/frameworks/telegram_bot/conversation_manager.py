@@ -1,6 +1,7 @@
 """Conversation management for Telegram bot users."""
 
-from typing import Dict, List
+from collections import OrderedDict, deque
+from typing import Deque, List
 from multimodal_rag.usecases.langgraph_agent.dtos import ChatMessage
 from multimodal_rag.frameworks.logging_config import get_logger
 
@@ -10,14 +11,19 @@ logger = get_logger(__name__)
 class ConversationManager:
     """Manages user conversations and chat history."""
 
-    def __init__(self, max_conversation_length: int = 10):
+    def __init__(self, max_conversation_length: int = 10, max_users: int = 10_000):
         """Initialize conversation manager.
 
         Args:
             max_conversation_length: Maximum number of messages to keep in history
+            max_users: Maximum number of users whose history is kept; the
+                least recently active users are dropped first
         """
-        self._user_conversations: Dict[str, List[ChatMessage]] = {}
+        self._user_conversations: "OrderedDict[str, Deque[ChatMessage]]" = (
+            OrderedDict()
+        )
         self._max_conversation_length = max_conversation_length
+        self._max_users = max_users
 
     def get_conversation_history(self, user_id: str) -> List[ChatMessage]:
         """Get conversation history for a user.
@@ -28,7 +34,7 @@ class ConversationManager:
         Returns:
             List of chat messages in conversation history
         """
-        return self._user_conversations.get(user_id, [])
+        return list(self._user_conversations.get(user_id, ()))
 
     def add_message(self, user_id: str, message: ChatMessage) -> None:
         """Add a message to user's conversation history.
@@ -38,16 +44,17 @@ class ConversationManager:
             message: Chat message to add
         """
         if user_id not in self._user_conversations:
-            self._user_conversations[user_id] = []
+            # Appending to a full deque drops its oldest message
+            self._user_conversations[user_id] = deque(
+                maxlen=self._max_conversation_length
+            )
+            while len(self._user_conversations) > self._max_users:
+                self._user_conversations.popitem(last=False)
+        else:
+            self._user_conversations.move_to_end(user_id)
 
         self._user_conversations[user_id].append(message)
 
-        # Trim conversation to max length
-        if len(self._user_conversations[user_id]) > self._max_conversation_length:
-            self._user_conversations[user_id] = self._user_conversations[user_id][
-                -self._max_conversation_length :
-            ]
-
         logger.debug(f"Added message to conversation for user {user_id}")
 
     def add_user_message(self, user_id: str, content: str) -> None:
@@ -102,4 +109,4 @@ class ConversationManager:
         Returns:
             Number of messages in conversation
         """
-        return len(self._user_conversations.get(user_id, []))
+        return len(self._user_conversations.get(user_id, ()))
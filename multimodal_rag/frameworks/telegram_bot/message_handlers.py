@@ -13,6 +13,47 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Seconds between typing indicators; Telegram clears one after 5 seconds
+TYPING_REFRESH_SECONDS = 4.5
+
+_WELCOME_TEMPLATE = (
+    "👋 Hello {name}!\n\n"
+    "I'm your intelligent document assistant powered by multimodal RAG. "
+    "I can help you find information from documents and answer your questions.\n\n"
+    "📖 Simply send me a message with your question, and I'll search through "
+    "the available documents to provide you with relevant answers.\n\n"
+    "🖼️ If there are relevant images or diagrams in the documents, "
+    "I'll include them in my response.\n\n"
+    "Commands:\n"
+    "• /help - Show this help message\n"
+    "• /clear - Clear conversation history\n\n"
+    "What would you like to know?"
+)
+
+_HELP_MESSAGE = (
+    "🤖 *Multimodal RAG Assistant Help*\n\n"
+    "*What I can do:*\n"
+    "• Answer questions based on document content\n"
+    "• Search through indexed documents\n"
+    "• Provide relevant images and diagrams\n"
+    "• Maintain conversation context\n\n"
+    "*How to use:*\n"
+    "1. Simply type your question\n"
+    "2. I'll search relevant documents\n"
+    "3. You'll get an answer with supporting images (if available)\n\n"
+    "*Commands:*\n"
+    "• /start - Start conversation\n"
+    "• /help - Show this help\n"
+    "• /clear - Clear conversation history\n\n"
+    "*Tips:*\n"
+    "• Be specific in your questions for better results\n"
+    "• You can ask follow-up questions for clarification\n"
+    "• Reference previous answers in your questions"
+)
+
+# Telegram objects are immutable, so one instance is shared by all replies
+_REMOVE_KEYBOARD = ReplyKeyboardRemove()
+
 
 class MessageHandlers:
     """Handles different types of Telegram messages and commands."""
@@ -34,11 +75,15 @@ class MessageHandlers:
             stop_event: Event to signal when to stop showing typing
         """
         try:
-            while not stop_event.is_set():
+            while True:
                 await context.bot.send_chat_action(chat_id=chat_id, action="typing")
                 try:
-                    await asyncio.wait_for(stop_event.wait(), timeout=4.0)
-                    break
+                    # Telegram shows the indicator for 5 seconds, so only resend
+                    # it if the reply is still pending when that is about to run out
+                    await asyncio.wait_for(
+                        stop_event.wait(), timeout=TYPING_REFRESH_SECONDS
+                    )
+                    return
                 except asyncio.TimeoutError:
                     continue
         except Exception as e:
@@ -51,53 +96,18 @@ class MessageHandlers:
         user = update.message.from_user
         logger.info(f"User {user.first_name} ({user.id}) started conversation")
 
-        welcome_message = (
-            f"👋 Hello {user.first_name}!\n\n"
-            "I'm your intelligent document assistant powered by multimodal RAG. "
-            "I can help you find information from documents and answer your questions.\n\n"
-            "📖 Simply send me a message with your question, and I'll search through "
-            "the available documents to provide you with relevant answers.\n\n"
-            "🖼️ If there are relevant images or diagrams in the documents, "
-            "I'll include them in my response.\n\n"
-            "Commands:\n"
-            "• /help - Show this help message\n"
-            "• /clear - Clear conversation history\n\n"
-            "What would you like to know?"
-        )
-
         await update.message.reply_text(
-            welcome_message,
+            _WELCOME_TEMPLATE.format(name=user.first_name),
             parse_mode=ParseMode.MARKDOWN,
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=_REMOVE_KEYBOARD,
         )
 
     async def handle_help(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /help command."""
-        help_message = (
-            "🤖 *Multimodal RAG Assistant Help*\n\n"
-            "*What I can do:*\n"
-            "• Answer questions based on document content\n"
-            "• Search through indexed documents\n"
-            "• Provide relevant images and diagrams\n"
-            "• Maintain conversation context\n\n"
-            "*How to use:*\n"
-            "1. Simply type your question\n"
-            "2. I'll search relevant documents\n"
-            "3. You'll get an answer with supporting images (if available)\n\n"
-            "*Commands:*\n"
-            "• /start - Start conversation\n"
-            "• /help - Show this help\n"
-            "• /clear - Clear conversation history\n\n"
-            "*Tips:*\n"
-            "• Be specific in your questions for better results\n"
-            "• You can ask follow-up questions for clarification\n"
-            "• Reference previous answers in your questions"
-        )
-
         await update.message.reply_text(
-            help_message,
+            _HELP_MESSAGE,
             parse_mode=ParseMode.MARKDOWN,
         )
 
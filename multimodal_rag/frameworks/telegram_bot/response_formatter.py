@@ -3,7 +3,7 @@
 import asyncio
 import io
 import base64
-from typing import List, Any, Optional
+from typing import List, Any, Optional, Tuple
 from telegram import Update, InputMediaPhoto, InlineKeyboardMarkup, InlineKeyboardButton
 from telegram.constants import ParseMode
 from telegram.error import BadRequest, TimedOut, NetworkError
@@ -82,17 +82,14 @@ class ResponseFormatter:
         if not chunk_ids_used:
             return None
 
-        chunk_buttons = []
+        buttons = [
+            InlineKeyboardButton(f"📄 {chunk_id}", callback_data=chunk_id)
+            for chunk_id in chunk_ids_used
+        ]
         # Create buttons in rows of 2
-        for i in range(0, len(chunk_ids_used), 2):
-            row = []
-            for j in range(i, min(i + 2, len(chunk_ids_used))):
-                chunk_id = chunk_ids_used[j]
-                button_text = f"📄 {chunk_id}"
-                row.append(InlineKeyboardButton(button_text, callback_data=chunk_id))
-            chunk_buttons.append(row)
-
-        return InlineKeyboardMarkup(chunk_buttons)
+        return InlineKeyboardMarkup(
+            [buttons[i : i + 2] for i in range(0, len(buttons), 2)]
+        )
 
     async def _send_response_with_pictures(
         self, update: Update, text: str, pictures: List[Any], reply_markup=None
@@ -104,42 +101,26 @@ class ResponseFormatter:
             # Prepare caption (truncate if necessary)
             caption = self._truncate_text(text, self._max_caption_length)
 
-            # Process pictures and create media group
-            for i, picture in enumerate(
-                pictures[:10]
-            ):  # Limit to 10 images per Telegram's constraint
-                try:
-                    if (
-                        hasattr(picture, "image")
-                        and hasattr(picture.image, "uri")
-                        and picture.image.uri
-                    ):
-                        data_uri = picture.image.uri
-                        if data_uri.startswith("data:image/"):
-                            header, encoded = data_uri.split(",", 1)
-                            image_bytes = base64.b64decode(encoded)
-                            image_data = io.BytesIO(image_bytes)
-                            image_data.name = f"image_{i}.jpg"
-
-                            # Add caption only to the first image
-                            if i == 0:
-                                media_group.append(
-                                    InputMediaPhoto(
-                                        media=image_data,
-                                        caption=caption,
-                                        parse_mode=ParseMode.MARKDOWN,
-                                    )
-                                )
-                            else:
-                                media_group.append(InputMediaPhoto(media=image_data))
-                        else:
-                            logger.warning(
-                                f"Invalid data URI format for picture {i}: {data_uri[:50]}..."
-                            )
-
-                except Exception as e:
-                    logger.warning(f"Error processing picture {i}: {e}")
-                    continue
+            # Decoding can take a while for large images, so it runs in a
+            # worker thread instead of blocking other users' updates
+            decoded = await asyncio.to_thread(
+                self._decode_pictures, pictures[:10]
+            )  # Limit to 10 images per Telegram's constraint
+            for i, image_bytes in decoded:
+                image_data = io.BytesIO(image_bytes)
+                image_data.name = f"image_{i}.jpg"
+
+                # Add caption only to the first image
+                if not media_group:
+                    media_group.append(
+                        InputMediaPhoto(
+                            media=image_data,
+                            caption=caption,
+                            parse_mode=ParseMode.MARKDOWN,
+                        )
+                    )
+                else:
+                    media_group.append(InputMediaPhoto(media=image_data))
 
             if media_group:
                 await update.message.reply_media_group(
@@ -174,6 +155,37 @@ class ResponseFormatter:
             logger.error(f"Unexpected error sending pictures: {e}")
             await self._send_text_response(update, text, reply_markup=reply_markup)
 
+    @staticmethod
+    def _decode_pictures(pictures: List[Any]) -> List[Tuple[int, bytes]]:
+        """Decode the base64 data URIs of pictures.
+
+        Args:
+            pictures: Pictures whose image URI holds the image data
+
+        Returns:
+            Index and image bytes of every picture that could be decoded
+        """
+        decoded = []
+        for i, picture in enumerate(pictures):
+            try:
+                if (
+                    hasattr(picture, "image")
+                    and hasattr(picture.image, "uri")
+                    and picture.image.uri
+                ):
+                    data_uri = picture.image.uri
+                    if data_uri.startswith("data:image/"):
+                        header, encoded = data_uri.split(",", 1)
+                        decoded.append((i, base64.b64decode(encoded)))
+                    else:
+                        logger.warning(
+                            f"Invalid data URI format for picture {i}: {data_uri[:50]}..."
+                        )
+
+            except Exception as e:
+                logger.warning(f"Error processing picture {i}: {e}")
+        return decoded
+
     async def _send_text_response(
         self,
         update: Update,
@@ -238,47 +250,47 @@ class ResponseFormatter:
         else:
             return text[: max_length - 3] + "..."
 
+    @staticmethod
+    def _pack(pieces: List[str], separator: str, max_length: int) -> List[str]:
+        """Greedily join consecutive pieces into strings of at most max_length.
+
+        A piece that is longer than max_length on its own is kept whole.
+        """
+        packed = []
+        buffer: List[str] = []
+        buffer_length = 0
+        for piece in pieces:
+            added = len(piece) + (len(separator) if buffer else 0)
+            if buffer and buffer_length + added > max_length:
+                packed.append(separator.join(buffer))
+                buffer = []
+                added = len(piece)
+                buffer_length = 0
+            buffer.append(piece)
+            buffer_length += added
+        if buffer:
+            packed.append(separator.join(buffer))
+        return packed
+
     def _split_text(self, text: str, max_length: int) -> List[str]:
         """Split text into chunks that fit within the message length limit."""
         if len(text) <= max_length:
             return [text]
 
-        chunks = []
-        current_chunk = ""
-
-        # Split by paragraphs first
-        paragraphs = text.split("\n\n")
-
-        for paragraph in paragraphs:
-            # If adding this paragraph would exceed the limit
-            if len(current_chunk) + len(paragraph) + 2 > max_length:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = ""
-
-                # If the paragraph itself is too long, split it further
-                if len(paragraph) > max_length:
-                    # Split by sentences
-                    sentences = paragraph.split(". ")
-                    for sentence in sentences:
-                        if len(current_chunk) + len(sentence) + 2 > max_length:
-                            if current_chunk:
-                                chunks.append(current_chunk.strip())
-                                current_chunk = ""
-
-                        if current_chunk:
-                            current_chunk += ". " + sentence
-                        else:
-                            current_chunk = sentence
-                else:
-                    current_chunk = paragraph
-            else:
-                if current_chunk:
-                    current_chunk += "\n\n" + paragraph
-                else:
-                    current_chunk = paragraph
-
-        if current_chunk:
-            chunks.append(current_chunk.strip())
-
-        return chunks
+        # Split by paragraphs first, and too long paragraphs by sentences.
+        # Blank pieces are dropped, since Telegram rejects empty messages.
+        pieces = []
+        for paragraph in text.split("\n\n"):
+            paragraph = paragraph.strip()
+            if len(paragraph) <= max_length:
+                if paragraph:
+                    pieces.append(paragraph)
+                continue
+            for part in self._pack(paragraph.split(". "), ". ", max_length):
+                # A single sentence over the limit is cut at max_length
+                for start in range(0, len(part), max_length):
+                    piece = part[start : start + max_length].strip()
+                    if piece:
+                        pieces.append(piece)
+
+        return self._pack(pieces, "\n\n", max_length)
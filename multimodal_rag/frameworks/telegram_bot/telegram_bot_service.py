@@ -45,6 +45,8 @@ class TelegramBotService:
         self._token = token
         self._agentic_rag_use_case = agentic_rag_use_case
         self._application: Optional[Application] = None
+        # Created in start_polling so that it belongs to the running loop
+        self._stop_event: Optional[asyncio.Event] = None
 
         # Initialize component managers
         self._conversation_manager = ConversationManager(max_conversation_length)
@@ -105,6 +107,7 @@ class TelegramBotService:
         """Start the bot with polling mode."""
         if not self._application:
             await self.initialize()
+        self._stop_event = asyncio.Event()
 
         try:
             logger.info("Starting Telegram bot polling...")
@@ -126,9 +129,8 @@ class TelegramBotService:
 
             logger.info("Telegram bot is now running...")
 
-            # Keep the bot running until stopped
-            while True:
-                await asyncio.sleep(1)
+            # Keep the bot running until shutdown() is called
+            await self._stop_event.wait()
 
         except asyncio.CancelledError:
             logger.info("Bot polling cancelled")
@@ -139,6 +141,8 @@ class TelegramBotService:
 
     async def shutdown(self) -> None:
         """Shutdown the bot gracefully."""
+        if self._stop_event is not None:
+            self._stop_event.set()
         if self._application:
             try:
                 logger.info("Stopping Telegram bot...")
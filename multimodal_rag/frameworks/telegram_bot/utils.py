@@ -1,3 +1,8 @@
+# Characters that need escaping in Telegram Markdown (v1): *, _, `, [
+# Underscores are replaced instead, since they are common in plain text
+_MARKDOWN_ESCAPES = str.maketrans({"_": "-", "*": r"\*", "`": r"\`", "[": r"\["})
+
+
 def escape_markdown(text: str) -> str:
     """Escape Markdown special characters for Telegram.
 
@@ -7,12 +12,4 @@ def escape_markdown(text: str) -> str:
     Returns:
         Escaped text safe for Markdown parsing
     """
-    # Characters that need escaping in Telegram Markdown (v1)
-    # For Markdown v1, we need to escape: *, _, `, [
-    escape_chars = ["*", "`", "["]
-
-    escaped_text = text.replace("_", "-")
-    for char in escape_chars:
-        escaped_text = escaped_text.replace(char, f"\\{char}")
-
-    return escaped_text
+    return text.translate(_MARKDOWN_ESCAPES)
@@ -1,9 +1,10 @@
 """Use cases for document indexing and retrieval operations."""
 
+import asyncio
 import json
 import uuid
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from docling_core.types.doc.document import DoclingDocument as DLDocument
 from docling.chunking import HybridChunker
@@ -232,79 +233,134 @@ class DocumentIndexingUseCase:
 
         logger.info(f"Starting bulk indexing from directory: {indexing_directory}")
 
-        for result_dir in indexing_path.iterdir():
+        json_files = []
+        # The file stem is the document id; the existence check for a file
+        # runs before the previous one is indexed, so it can't catch a repeat
+        seen_ids = set()
+        for result_dir in sorted(indexing_path.iterdir()):
             if not result_dir.is_dir():
                 continue
 
             logger.info(f"Processing directory: {result_dir.name}")
 
             # Look for the single JSON file in the directory
-            json_files = list(result_dir.glob("*.json"))
+            dir_json_files = list(result_dir.glob("*.json"))
 
-            if not json_files:
+            if not dir_json_files:
                 logger.warning(f"No JSON file found in directory: {result_dir.name}")
                 continue
 
-            if len(json_files) > 1:
+            if len(dir_json_files) > 1:
                 logger.warning(
-                    f"Multiple JSON files found in {result_dir.name}, processing the first one: {json_files[0].name}"
+                    f"Multiple JSON files found in {result_dir.name}, processing the first one: {dir_json_files[0].name}"
                 )
 
-            json_file = json_files[0]
-
-            try:
-                logger.info(f"Processing file: {json_file.name}")
+            if dir_json_files[0].stem in seen_ids:
+                logger.warning(
+                    f"Document {dir_json_files[0].stem} in {result_dir.name} was already found in another directory, skipping"
+                )
+                continue
+            seen_ids.add(dir_json_files[0].stem)
+            json_files.append(dir_json_files[0])
+
+        async def prepare(json_file: Path):
+            document_id = json_file.stem
+            if await self._document_repository.get_document(document_id, index_name):
+                logger.warning(f"Document {document_id} already exists in index {index_name}")
+                return None
+            # Parsing, entity building and chunking are CPU-bound; run them in a
+            # worker thread so they overlap with indexing of the previous file.
+            return await asyncio.to_thread(
+                self._prepare_document, json_file, document_id, chunker
+            )
+
+        # Two-stage pipeline: while one document is embedded and indexed,
+        # the next one is being prepared.
+        next_task = asyncio.create_task(prepare(json_files[0])) if json_files else None
+        try:
+            for position, json_file in enumerate(json_files):
+                task, next_task = next_task, None
+                try:
+                    prepared = await task
+                except Exception as e:
+                    logger.error(f"Failed to process {json_file}: {str(e)}")
+                    prepared = None
 
-                with open(json_file, "r", encoding="utf-8") as f:
-                    dl_doc = json.load(f)
-                document_id = json_file.stem
+                if position + 1 < len(json_files):
+                    next_task = asyncio.create_task(
+                        prepare(json_files[position + 1])
+                    )
 
-                if await self._document_repository.get_document(document_id, index_name):
-                    logger.warning(f"Document {document_id} already exists in index {index_name}")
+                if prepared is None:
                     continue
 
-                dl_doc = DLDocument.model_validate(dl_doc)
-                document, texts, pictures, tables = (
-                    create_document_entities_from_docling(dl_doc, document_id)
-                )
+                document_id, document, texts, pictures, tables, chunks = prepared
 
-                chunk_iter = chunker.chunk(dl_doc=dl_doc)
-                chunks = []
+                try:
+                    response = await self.bulk_index_document_with_elements_and_chunks(
+                        document=document,
+                        texts=texts,
+                        pictures=pictures,
+                        tables=tables,
+                        chunks=chunks,
+                        document_id=document_id,
+                        index_name=index_name,
+                        generate_embeddings=generate_embeddings,
+                    )
 
-                for i, dl_chunk in enumerate(chunk_iter):
-                    chunk = DocChunk.from_docling_chunk(dl_chunk, document_id, i)
-                    chunk.text = chunker.contextualize(chunk=dl_chunk)
-                    chunks.append(chunk)
+                    responses.append(response)
+                    logger.info(
+                        f"Successfully indexed document {document_id}: {response.total_indexed} items"
+                    )
 
-                logger.info(
-                    f"Generated {len(chunks)} chunks for document: {json_file.name}"
-                )
+                    if response.errors:
+                        logger.warning(
+                            f"Errors during indexing of {document_id}: {response.errors}"
+                        )
 
+                except Exception as e:
+                    logger.error(f"Failed to process {json_file}: {str(e)}")
+                    continue
+        finally:
+            # Don't leave the next document being prepared if the run is cancelled
+            if next_task is not None:
+                next_task.cancel()
 
-                response = await self.bulk_index_document_with_elements_and_chunks(
-                    document=document,
-                    texts=texts,
-                    pictures=pictures,
-                    tables=tables,
-                    chunks=chunks,
-                    document_id=document_id,
-                    index_name=index_name,
-                    generate_embeddings=generate_embeddings,
-                )
+        logger.info(f"Bulk indexing completed. Processed {len(responses)} documents.")
+        return responses
 
-                responses.append(response)
-                logger.info(
-                    f"Successfully indexed document {document_id}: {response.total_indexed} items"
-                )
+    @staticmethod
+    def _prepare_document(
+        json_file: Path, document_id: str, chunker: HybridChunker
+    ) -> Tuple[
+        str,
+        DoclingDocument,
+        List[DocumentText],
+        List[DocumentPicture],
+        List[DocumentTable],
+        List[DocChunk],
+    ]:
+        """Load a Docling JSON file and build its entities and chunks."""
+        logger.info(f"Processing file: {json_file.name}")
+
+        with open(json_file, "r", encoding="utf-8") as f:
+            dl_doc = json.load(f)
+
+        dl_doc = DLDocument.model_validate(dl_doc)
+        document, texts, pictures, tables = create_document_entities_from_docling(
+            dl_doc, document_id
+        )
 
-                if response.errors:
-                    logger.warning(
-                        f"Errors during indexing of {document_id}: {response.errors}"
-                    )
+        chunks = []
+        # Items split across several chunks are dumped only once
+        doc_item_cache = {}
+        for i, dl_chunk in enumerate(chunker.chunk(dl_doc=dl_doc)):
+            chunk = DocChunk.from_docling_chunk(
+                dl_chunk, document_id, i, doc_item_cache=doc_item_cache
+            )
+            chunk.text = chunker.contextualize(chunk=dl_chunk)
+            chunks.append(chunk)
 
-            except Exception as e:
-                logger.error(f"Failed to process {json_file}: {str(e)}")
-                continue
+        logger.info(f"Generated {len(chunks)} chunks for document: {json_file.name}")
 
-        logger.info(f"Bulk indexing completed. Processed {len(responses)} documents.")
-        return responses
+        return document_id, document, texts, pictures, tables, chunks
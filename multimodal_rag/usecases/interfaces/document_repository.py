@@ -1,7 +1,9 @@
 """Interfaces for document indexing and search operations."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Union
+
+import numpy as np
 
 from ...entities.document import (
     DoclingDocument,
@@ -119,7 +121,7 @@ class IDocumentIndexRepository(ABC):
     async def search_chunks(
         self,
         query: Optional[str] = None,
-        vector: Optional[List[float]] = None,
+        vector: Optional[Union[List[float], np.ndarray]] = None,
         filters: Optional[Dict[str, Any]] = None,
         size: int = 10,
         index_name: Optional[str] = None,
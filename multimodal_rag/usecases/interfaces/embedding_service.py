@@ -3,12 +3,14 @@
 from abc import ABC, abstractmethod
 from typing import List, Union
 
+import numpy as np
+
 
 class EmbeddingServiceInterface(ABC):
     """Interface for embedding generation services."""
 
     @abstractmethod
-    async def embed_content(self, content: Union[str, List[str]]) -> List[List[float]]:
+    async def embed_content(self, content: Union[str, List[str]]) -> np.ndarray:
         """
         Generate embeddings for the given content.
         
@@ -16,12 +18,12 @@ class EmbeddingServiceInterface(ABC):
             content: Single text string or list of text strings to embed
             
         Returns:
-            List of embedding vectors (list of floats)
+            float32 array of shape (len(content), dimensions)
         """
         pass
 
     @abstractmethod
-    async def embed_single(self, text: str) -> List[float]:
+    async def embed_single(self, text: str) -> np.ndarray:
         """
         Generate embedding for a single text string.
         
@@ -29,7 +31,7 @@ class EmbeddingServiceInterface(ABC):
             text: Text string to embed
             
         Returns:
-            Embedding vector as list of floats
+            Embedding vector as a float32 array
         """
         pass
 
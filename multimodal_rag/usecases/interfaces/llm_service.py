@@ -69,11 +69,11 @@ class LLMServiceInterface(ABC):
         pass
 
     @abstractmethod
-    def get_available_models(self) -> list[str]:
+    def get_available_models(self) -> tuple[str, ...]:
         """
-        Get list of available models.
+        Get the available models.
 
         Returns:
-            List of available model names
+            Tuple of available model names
         """
         pass
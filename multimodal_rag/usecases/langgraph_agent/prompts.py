@@ -1,6 +1,38 @@
 """Prompts for the agentic RAG system."""
 
 
+_ANSWER_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "answer": {
+            "type": "string",
+            "description": "The main answer content",
+        },
+        "chunk_ids_used": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of chunk IDs used to generate this answer",
+        },
+    },
+    "required": ["answer", "chunk_ids_used"],
+}
+
+_RETRIEVER_TOOL_DEFINITION = {
+    "name": "retrieve_documents",
+    "description": "Search and return information from the document repository.",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search query for retrieving relevant documents",
+            }
+        },
+        "required": ["query"],
+    },
+}
+
+
 class AgenticRAGPrompts:
     """Collection of prompts used in the agentic RAG workflow."""
 
@@ -60,37 +92,18 @@ Conversation History: {history}
 
     @staticmethod
     def get_retriever_tool_definition() -> dict:
-        """Tool definition for the document retriever."""
-        return {
-            "name": "retrieve_documents",
-            "description": "Search and return information from the document repository.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query for retrieving relevant documents",
-                    }
-                },
-                "required": ["query"],
-            },
-        }
+        """Tool definition for the document retriever.
+
+        The same object is returned on every call, so that the LLM service can
+        reuse the tool config it builds from it; callers must not modify it.
+        """
+        return _RETRIEVER_TOOL_DEFINITION
 
     @staticmethod
     def get_answer_response_schema() -> dict:
-        """Response schema for structured answer generation."""
-        return {
-            "type": "object",
-            "properties": {
-                "answer": {
-                    "type": "string",
-                    "description": "The main answer content",
-                },
-                "chunk_ids_used": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of chunk IDs used to generate this answer",
-                },
-            },
-            "required": ["answer", "chunk_ids_used"],
-        }
+        """Response schema for structured answer generation.
+
+        The same object is returned on every call, so that the LLM service can
+        reuse the config it derives from it; callers must not modify it.
+        """
+        return _ANSWER_RESPONSE_SCHEMA
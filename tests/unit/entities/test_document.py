@@ -0,0 +1,124 @@
+"""Unit tests for the document entities and their Elasticsearch round trip."""
+
+import numpy as np
+import orjson
+import pytest
+from PIL import Image
+from docling_core.transforms.chunker.hierarchical_chunker import HierarchicalChunker
+from docling_core.types.doc.base import BoundingBox, CoordOrigin
+from docling_core.types.doc.document import (
+    DoclingDocument as DLDocument,
+    DocumentOrigin as DLDocumentOrigin,
+    ImageRef,
+    ProvenanceItem,
+    TableCell as DLTableCell,
+    TableData as DLTableData,
+)
+from docling_core.types.doc.labels import DocItemLabel
+
+from multimodal_rag.entities.document import (
+    DocChunk,
+    DoclingDocument,
+    DocumentPicture,
+    DocumentTable,
+    DocumentText,
+)
+from multimodal_rag.entities.utils import create_document_entities_from_docling
+
+
+def _prov(page_no: int = 1) -> ProvenanceItem:
+    """Provenance with a bottom-left bounding box."""
+    return ProvenanceItem(
+        page_no=page_no,
+        bbox=BoundingBox(
+            l=1.5, t=40.0, r=30.25, b=2.0, coord_origin=CoordOrigin.BOTTOMLEFT
+        ),
+        charspan=(0, 5),
+    )
+
+
+@pytest.fixture
+def dl_doc() -> DLDocument:
+    """Docling document with a heading, text, captioned picture and table."""
+    doc = DLDocument(
+        name="sample",
+        origin=DLDocumentOrigin(
+            mimetype="application/pdf", binary_hash=123, filename="sample.pdf"
+        ),
+    )
+    doc.add_heading("Title", prov=_prov())
+    doc.add_text(DocItemLabel.TEXT, "Hello world", prov=_prov())
+    caption = doc.add_text(DocItemLabel.CAPTION, "A figure", prov=_prov(2))
+    doc.add_picture(
+        image=ImageRef.from_pil(Image.new("RGB", (4, 3), "red"), dpi=72),
+        caption=caption,
+        prov=_prov(2),
+    )
+    cell = DLTableCell(
+        bbox=BoundingBox(l=0, t=0, r=1, b=1),
+        row_span=1,
+        col_span=1,
+        start_row_offset_idx=0,
+        end_row_offset_idx=1,
+        start_col_offset_idx=0,
+        end_col_offset_idx=1,
+        text="x",
+        column_header=True,
+    )
+    doc.add_table(
+        data=DLTableData(table_cells=[cell], num_rows=1, num_cols=1), prov=_prov(3)
+    )
+    return doc
+
+
+def _through_elastic(entity):
+    """Serialize an entity for indexing and read it back like a search hit."""
+    return orjson.loads(orjson.dumps(entity.to_elastic_data()))
+
+
+class TestDoclingConversion:
+    """Test cases for building entities from Docling documents."""
+
+    def test_refs_are_stored_as_json_pointers(self, dl_doc):
+        """Test that refs keep Docling's '$ref' pointers instead of being lost."""
+        _, texts, pictures, _ = create_document_entities_from_docling(dl_doc, "doc")
+
+        assert texts[0].parent_ref == "#/body"
+        assert pictures[0].parent_ref == "#/body"
+        assert pictures[0].captions == ["#/texts/2"]
+
+        stored = _through_elastic(pictures[0])["picture"]
+        assert stored["captions"] == ["#/texts/2"]
+        assert stored["parent_ref"] == "#/body"
+
+    def test_entities_survive_elastic_round_trip(self, dl_doc):
+        """Test that every entity reads back equal to what was indexed."""
+        document, texts, pictures, tables = create_document_entities_from_docling(
+            dl_doc, "doc"
+        )
+        pairs = [(document, DoclingDocument)]
+        pairs += [(text, DocumentText) for text in texts]
+        pairs += [(picture, DocumentPicture) for picture in pictures]
+        pairs += [(table, DocumentTable) for table in tables]
+
+        for entity, entity_cls in pairs:
+            restored = entity_cls.from_elastic_hit(_through_elastic(entity))
+            assert restored.model_dump() == entity.model_dump()
+
+        assert texts[1].text_id == "doc_text_1"
+        assert texts[1].prov[0].bbox.coord_origin == "BOTTOMLEFT"
+        assert pictures[0].image.uri.startswith("data:image/png;base64,")
+        assert tables[0].data.table_cells[0].column_header
+
+    def test_chunk_vector_survives_elastic_round_trip(self, dl_doc):
+        """Test that chunk embeddings are float32 arrays before and after indexing."""
+        dl_chunk = next(iter(HierarchicalChunker().chunk(dl_doc)))
+        chunk = DocChunk.from_docling_chunk(
+            dl_chunk, "doc", 0, vector=[0.1, 0.2, 0.3], doc_item_cache={}
+        )
+
+        restored = DocChunk.from_elastic_hit(_through_elastic(chunk))
+
+        assert chunk.vector.dtype == restored.vector.dtype == np.float32
+        np.testing.assert_array_equal(restored.vector, chunk.vector)
+        assert restored.model_dump() == chunk.model_dump()
@@ -0,0 +1,28 @@
+"""Shared fixtures for the framework tests."""
+
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def record_disk_threads(monkeypatch):
+    """Record the threads running a cache class's SQLite reads and writes.
+
+    Returns a function that patches the disk methods of a cache class and
+    returns the list that the ids of the threads calling them are added to.
+    """
+
+    def _record(cache_class):
+        threads = []
+        for name in ("_get_from_disk", "_write_to_disk"):
+            method = getattr(cache_class, name)
+
+            def record(self, *args, _method=method):
+                threads.append(threading.get_ident())
+                return _method(self, *args)
+
+            monkeypatch.setattr(cache_class, name, record)
+        return threads
+
+    return _record
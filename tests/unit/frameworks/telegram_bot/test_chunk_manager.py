@@ -0,0 +1,78 @@
+"""Unit tests for the Telegram bot chunk manager."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from multimodal_rag.frameworks.telegram_bot import chunk_manager
+from multimodal_rag.frameworks.telegram_bot.chunk_manager import (
+    ChunkManager,
+    ChunkRecord,
+)
+
+
+class TestChunkManager:
+    """Test cases for storing and formatting user chunks."""
+
+    def test_store_and_get_chunks(self):
+        """Test that stored chunks are returned as compact records."""
+        manager = ChunkManager()
+        chunks = [
+            SimpleNamespace(text="first", document_id="doc1"),
+            SimpleNamespace(text="second", document_id="doc2"),
+        ]
+
+        manager.store_chunks("user", ["c1", "c2"], chunks)
+
+        assert manager.get_chunk("user", "c2") == ChunkRecord("second", "doc2", "c2")
+        assert manager.get_chunk("user", "missing") is None
+        assert manager.get_chunk("other", "c1") is None
+        assert manager.get_user_chunk_ids("user") == ["c1", "c2"]
+        with pytest.raises(AttributeError):
+            manager.get_chunk("user", "c1").__dict__
+
+    def test_least_recently_active_user_is_evicted(self):
+        """Test that only max_users users keep their chunks."""
+        manager = ChunkManager(max_users=2)
+        chunk = SimpleNamespace(text="text", document_id="doc")
+
+        manager.store_chunks("a", ["c1"], [chunk])
+        manager.store_chunks("b", ["c1"], [chunk])
+        manager.get_chunk("a", "c1")
+        manager.store_chunks("c", ["c1"], [chunk])
+
+        assert manager.get_chunk("b", "c1") is None
+        assert manager.get_chunk("a", "c1") is not None
+        assert manager.get_chunk("c", "c1") is not None
+
+    def test_inactive_users_expire(self, monkeypatch):
+        """Test that chunks of users idle longer than the TTL are dropped."""
+        now = [1000.0]
+        monkeypatch.setattr(chunk_manager.time, "monotonic", lambda: now[0])
+        manager = ChunkManager(ttl_seconds=60)
+        chunk = SimpleNamespace(text="text", document_id="doc")
+
+        manager.store_chunks("a", ["c1"], [chunk])
+        manager.store_chunks("b", ["c1"], [chunk])
+        now[0] += 40
+        assert manager.get_chunk("b", "c1") is not None
+
+        now[0] += 30
+        assert manager.get_chunk("a", "c1") is None
+        manager.store_chunks("c", ["c1"], [chunk])
+        assert manager.get_user_chunk_ids("b") == ["c1"]
+
+        now[0] += 61
+        manager.store_chunks("c", ["c2"], [chunk])
+        assert manager.get_user_chunk_ids("b") == []
+        assert manager.get_user_chunk_ids("c") == ["c1", "c2"]
+
+    def test_format_chunk_content_truncates_long_text(self):
+        """Test that long chunk text is cut to the maximum length."""
+        manager = ChunkManager()
+        record = ChunkRecord("x" * 20, "doc", "c1")
+
+        message = manager.format_chunk_content(record, max_length=5)
+
+        assert message.endswith("*Content:*\nxxxxx...")
+        assert "Document Chunk: c1" in message
@@ -0,0 +1,37 @@
+"""Unit tests for the Telegram bot conversation manager."""
+
+from multimodal_rag.frameworks.telegram_bot.conversation_manager import (
+    ConversationManager,
+)
+
+
+class TestConversationManager:
+    """Test cases for per-user conversation history."""
+
+    def test_history_keeps_latest_messages(self):
+        """Test that history is trimmed to the maximum conversation length."""
+        manager = ConversationManager(max_conversation_length=3)
+
+        for i in range(5):
+            manager.add_user_message("user", f"message {i}")
+
+        history = manager.get_conversation_history("user")
+        assert [message.content for message in history] == [
+            "message 2",
+            "message 3",
+            "message 4",
+        ]
+        assert manager.get_conversation_count("user") == 3
+
+    def test_least_recently_active_user_is_evicted(self):
+        """Test that only max_users users keep their history."""
+        manager = ConversationManager(max_users=2)
+
+        manager.add_user_message("a", "hi")
+        manager.add_user_message("b", "hi")
+        manager.add_assistant_message("a", "hello")
+        manager.add_user_message("c", "hi")
+
+        assert manager.get_active_users() == ["a", "c"]
+        assert manager.get_conversation_count("a") == 2
+        assert manager.get_conversation_history("b") == []
@@ -0,0 +1,54 @@
+"""Unit tests for the Telegram bot message handlers."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from multimodal_rag.frameworks.telegram_bot import message_handlers
+from multimodal_rag.frameworks.telegram_bot.message_handlers import MessageHandlers
+
+
+def _context():
+    """Build a bot context whose chat actions are recorded."""
+    return SimpleNamespace(bot=SimpleNamespace(send_chat_action=AsyncMock()))
+
+
+class TestTypingIndicator:
+    """Test cases for the typing indicator shown while a reply is pending."""
+
+    @pytest.mark.asyncio
+    async def test_fast_reply_sends_single_chat_action(self):
+        """Test that a reply arriving before the refresh sends one action."""
+        handlers = MessageHandlers(SimpleNamespace())
+        context = _context()
+        stop_event = asyncio.Event()
+
+        task = asyncio.create_task(
+            handlers._show_typing_continuously(context, 1, stop_event)
+        )
+        await asyncio.sleep(0)
+        stop_event.set()
+        await task
+
+        context.bot.send_chat_action.assert_awaited_once_with(
+            chat_id=1, action="typing"
+        )
+
+    @pytest.mark.asyncio
+    async def test_slow_reply_refreshes_chat_action(self, monkeypatch):
+        """Test that the indicator is resent while the reply is pending."""
+        monkeypatch.setattr(message_handlers, "TYPING_REFRESH_SECONDS", 0.01)
+        handlers = MessageHandlers(SimpleNamespace())
+        context = _context()
+        stop_event = asyncio.Event()
+
+        task = asyncio.create_task(
+            handlers._show_typing_continuously(context, 1, stop_event)
+        )
+        await asyncio.sleep(0.05)
+        stop_event.set()
+        await task
+
+        assert context.bot.send_chat_action.await_count >= 2
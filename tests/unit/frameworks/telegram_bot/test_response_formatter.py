@@ -0,0 +1,80 @@
+"""Unit tests for the Telegram bot response formatter."""
+
+from types import SimpleNamespace
+
+from multimodal_rag.frameworks.telegram_bot.response_formatter import (
+    ResponseFormatter,
+)
+
+
+class TestSplitText:
+    """Test cases for splitting long responses into messages."""
+
+    def test_short_text_is_not_split(self):
+        """Test that text within the limit is returned unchanged."""
+        assert ResponseFormatter()._split_text("short", 10) == ["short"]
+
+    def test_paragraphs_are_packed_greedily(self):
+        """Test that as many paragraphs as fit are sent together."""
+        text = "\n\n".join(["aaaa", "bbbb", "cccc", "dddd"])
+
+        chunks = ResponseFormatter()._split_text(text, 10)
+
+        assert chunks == ["aaaa\n\nbbbb", "cccc\n\ndddd"]
+
+    def test_long_paragraph_is_split_by_sentences(self):
+        """Test that a paragraph over the limit is split between sentences."""
+        text = "one two. three four. five six\n\nend"
+
+        chunks = ResponseFormatter()._split_text(text, 20)
+
+        assert chunks == ["one two. three four", "five six\n\nend"]
+        assert all(len(chunk) <= 20 for chunk in chunks)
+
+    def test_long_sentence_is_cut_at_limit(self):
+        """Test that no chunk exceeds the limit, even for a single long word."""
+        chunks = ResponseFormatter()._split_text("x" * 25, 10)
+
+        assert chunks == ["x" * 10, "x" * 10, "x" * 5]
+
+    def test_blank_paragraphs_give_no_empty_chunks(self):
+        """Test that whitespace-only paragraphs and sentences are dropped."""
+        text = "aaaa\n\n   \n\n\n\n" + "b. " + " " * 12 + ". c" + "\n\n \t "
+
+        chunks = ResponseFormatter()._split_text(text, 10)
+
+        assert chunks
+        assert all(chunk.strip() for chunk in chunks)
+        assert all(len(chunk) <= 10 for chunk in chunks)
+
+
+class TestDecodePictures:
+    """Test cases for decoding picture data URIs."""
+
+    def test_decodes_valid_data_uris_only(self):
+        """Test that invalid pictures are skipped and indices are kept."""
+        pictures = [
+            SimpleNamespace(image=SimpleNamespace(uri="https://example.com/a.png")),
+            SimpleNamespace(image=SimpleNamespace(uri="data:image/png;base64,aGk=")),
+            SimpleNamespace(image=SimpleNamespace(uri="data:image/png;base64")),
+        ]
+
+        assert ResponseFormatter._decode_pictures(pictures) == [(1, b"hi")]
+
+
+class TestChunkButtons:
+    """Test cases for the source chunk keyboard."""
+
+    def test_buttons_are_laid_out_in_rows_of_two(self):
+        """Test that an odd number of chunks leaves one button on the last row."""
+        markup = ResponseFormatter()._create_chunk_buttons(["c1", "c2", "c3"])
+
+        rows = [
+            [button.callback_data for button in row] for row in markup.inline_keyboard
+        ]
+        assert rows == [["c1", "c2"], ["c3"]]
+        assert markup.inline_keyboard[0][0].text == "📄 c1"
+
+    def test_no_chunks_gives_no_keyboard(self):
+        """Test that no keyboard is built without chunk IDs."""
+        assert ResponseFormatter()._create_chunk_buttons([]) is None
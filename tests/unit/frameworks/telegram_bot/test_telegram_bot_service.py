@@ -0,0 +1,35 @@
+"""Unit tests for the Telegram bot service."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from multimodal_rag.frameworks.telegram_bot.telegram_bot_service import (
+    TelegramBotService,
+)
+
+
+class TestTelegramBotService:
+    """Test cases for the bot polling lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_start_polling_returns_after_shutdown(self):
+        """Test that polling keeps running until shutdown is called."""
+        service = TelegramBotService("token", MagicMock())
+        application = MagicMock()
+        for name in ("initialize", "start", "stop", "shutdown"):
+            setattr(application, name, AsyncMock())
+        application.updater.start_polling = AsyncMock()
+        application.updater.stop = AsyncMock()
+        application.bot.set_my_commands = AsyncMock()
+        service._application = application
+
+        polling = asyncio.create_task(service.start_polling())
+        await asyncio.sleep(0.01)
+        assert not polling.done()
+
+        await service.shutdown()
+        await asyncio.wait_for(polling, timeout=1)
+
+        application.stop.assert_awaited_once()
@@ -0,0 +1,8 @@
+"""Unit tests for the Telegram bot utilities."""
+
+from multimodal_rag.frameworks.telegram_bot.utils import escape_markdown
+
+
+def test_escape_markdown():
+    """Test that Markdown characters are escaped and underscores replaced."""
+    assert escape_markdown("a_b *c* `d` [e](f)") == r"a-b \*c\* \`d\` \[e](f)"
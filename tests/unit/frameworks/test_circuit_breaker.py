@@ -0,0 +1,55 @@
+"""Unit tests for the circuit breaker."""
+
+from multimodal_rag.frameworks import circuit_breaker
+from multimodal_rag.frameworks.circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker:
+    """Test cases for the circuit breaker states."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that only consecutive failures open the breaker."""
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+        assert not breaker.available()
+
+    def test_half_open_limits_trials_and_closes_on_success(self, monkeypatch):
+        """Test that an expired open period lets a few trial calls through."""
+        now = [100.0]
+        monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker(
+            failure_threshold=1, open_seconds=10, half_open_requests=2
+        )
+        breaker.record_failure()
+
+        now[0] += 10
+        assert breaker.available()
+        assert breaker.allow() and breaker.allow()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow()
+
+    def test_failed_trial_reopens(self, monkeypatch):
+        """Test that a failing trial call opens the breaker again."""
+        now = [100.0]
+        monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=1, open_seconds=10)
+        breaker.record_failure()
+
+        now[0] += 10
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
@@ -0,0 +1,41 @@
+"""Unit tests for the embedding cache."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from multimodal_rag.frameworks.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    """Test cases for the two-tier embedding cache."""
+
+    @pytest.mark.asyncio
+    async def test_cached_vectors_are_read_only(self):
+        """Test that callers can't change vectors held by the cache."""
+        cache = EmbeddingCache(memory_size=8)
+        vector = np.array([1.0, 2.0], dtype=np.float32)
+
+        await cache.set_many({b"k": vector})
+        vector[0] = 5.0
+        cached = await cache.get(b"k")
+
+        assert list(cached) == [1.0, 2.0]
+        with pytest.raises(ValueError):
+            cached[0] = 5.0
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_runs_in_worker_thread(self, tmp_path, record_disk_threads):
+        """Test that SQLite reads and writes happen off the event loop thread."""
+        path = str(tmp_path / "embeddings.sqlite3")
+        loop_thread = threading.get_ident()
+        threads = record_disk_threads(EmbeddingCache)
+
+        await EmbeddingCache(path, memory_size=0).set_many({b"k": [1.0, 2.0]})
+        cached = await EmbeddingCache(path).get_many([b"k", b"missing"])
+
+        assert list(cached) == [b"k"]
+        assert list(cached[b"k"]) == [1.0, 2.0]
+        assert not cached[b"k"].flags.writeable
+        assert len(threads) == 2 and loop_thread not in threads
@@ -0,0 +1,304 @@
+"""Unit tests for the Google GenAI base service."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import MagicMock
+from google.genai.errors import APIError, ClientError
+
+from multimodal_rag.frameworks import google_genai_base_service
+from multimodal_rag.frameworks.google_genai_base_service import (
+    GoogleGenAIBaseService,
+    parse_retry_delay_from_error,
+)
+
+
+class TestGoogleGenAIBaseService:
+    """Test cases for API key switching."""
+
+    @pytest.fixture
+    def service(self):
+        """Base service with three API keys."""
+        return GoogleGenAIBaseService(api_keys=["key-0", "key-1", "key-2"])
+
+    @pytest.mark.asyncio
+    async def test_switch_skips_keys_in_cooldown(self, service):
+        """Test that a recently rate-limited key is skipped."""
+        service._key_cooldown[1] = time.monotonic() + 30
+
+        assert await service._switch_to_next_api_key()
+        assert service._token_index == 2
+
+    @pytest.mark.asyncio
+    async def test_switch_waits_for_earliest_key_when_all_cooling_down(
+        self, service, monkeypatch
+    ):
+        """Test that the service waits only until the first key is usable again."""
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(google_genai_base_service.asyncio, "sleep", fake_sleep)
+        now = time.monotonic()
+        service._key_cooldown[:] = [now + 30, now + 50, now + 10]
+
+        assert await service._switch_to_next_api_key()
+        assert service._token_index == 2
+        assert len(sleeps) == 1 and 0 < sleeps[0] <= 10
+
+    def test_services_share_clients_per_api_key(self, service):
+        """Test that services using the same API key reuse one client."""
+        other = GoogleGenAIBaseService(api_keys=["key-0", "key-other"])
+
+        assert other._get_client(0) is service._get_client(0)
+        assert other._get_client(1) is not service._get_client(1)
+
+    @pytest.mark.asyncio
+    async def test_close_shared_clients_empties_pool(self, service):
+        """Test that closing the shared clients drops them from the pool."""
+        client = service._get_client(0)
+        await google_genai_base_service.close_shared_clients()
+
+        assert google_genai_base_service._CLIENT_POOL == {}
+        other = GoogleGenAIBaseService(api_keys="key-0")
+        assert other._get_client(0) is not client
+
+    @pytest.mark.asyncio
+    async def test_single_key_does_not_switch(self):
+        """Test that a single API key has nothing to switch to."""
+        service = GoogleGenAIBaseService(api_keys="key-0")
+
+        assert not await service._switch_to_next_api_key()
+
+    def test_server_delay_is_spread_but_never_shortened(self):
+        """Test that a delay requested by the server gets jitter on top."""
+        error = Exception("Please retry in 10s.")
+
+        # A fresh service per call keeps the circuit breaker closed
+        delays = {
+            GoogleGenAIBaseService(api_keys="key-0")._handle_operation_error(
+                "op", error, 0, 0
+            )
+            for _ in range(20)
+        }
+
+        assert all(10.0 <= delay <= 11.0 for delay in delays)
+        assert len(delays) > 1
+
+    def test_backoff_grows_and_honors_server_hint(self):
+        """Test that backoff is capped, jittered and never below the server hint."""
+        backoff = GoogleGenAIBaseService._backoff
+
+        assert all(0 <= backoff(0) <= 0.5 for _ in range(20))
+        assert all(0 <= backoff(20) <= 60.0 for _ in range(20))
+        # A server delay equal to the old 60 s default is still honored
+        assert all(60.0 <= backoff(0, 60.0) <= 66.0 for _ in range(20))
+
+
+class TestParseRetryDelayFromError:
+    """Test cases for reading retry delays from errors."""
+
+    def test_reads_retry_info_from_api_error(self):
+        """Test that the RetryInfo detail of an API error is used."""
+        error = APIError(
+            429,
+            {
+                "error": {
+                    "code": 429,
+                    "message": "Quota exceeded, retry in 5s",
+                    "status": "RESOURCE_EXHAUSTED",
+                    "details": [
+                        {
+                            "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                            "retryDelay": "22s",
+                        }
+                    ],
+                }
+            },
+        )
+
+        assert parse_retry_delay_from_error(error) == 22.0
+
+    def test_reads_retry_after_header(self):
+        """Test that the Retry-After header is used when the body has no hint."""
+        response = SimpleNamespace(headers={"retry-after": "7"})
+        error = APIError(429, {"error": {"message": "Too many requests"}}, response)
+
+        assert parse_retry_delay_from_error(error) == 7.0
+
+    def test_falls_back_to_message(self):
+        """Test that plain exceptions are parsed from their message."""
+        assert parse_retry_delay_from_error(Exception("retry_delay: 3")) == 3.0
+        assert parse_retry_delay_from_error(Exception("failed")) == 60.0
+        assert parse_retry_delay_from_error(Exception("retry after 15 seconds")) == 15.0
+        assert parse_retry_delay_from_error(Exception("Please retry in 2.5s.")) == 2.5
+
+    def test_ignores_numbers_that_are_not_delays(self):
+        """Test that numbers merely followed by a word starting with s are ignored."""
+        error = Exception("500 server error, please retry")
+
+        assert parse_retry_delay_from_error(error) == 60.0
+
+
+class _EchoService(GoogleGenAIBaseService):
+    """Base service with a test operation that fails a set number of times."""
+
+    def __init__(self, errors, **kwargs):
+        super().__init__(**kwargs)
+        self.errors = list(errors)
+        self.used_keys = []
+        self._operations["echo"] = self._execute_echo
+
+    def _execute_echo(self, client, value):
+        self.used_keys.append(self._clients.index(client))
+        if self.errors:
+            raise self.errors.pop(0)
+        return value
+
+
+class _TaggedService(GoogleGenAIBaseService):
+    """Base service whose test operation fails a set number of times per tag."""
+
+    def __init__(self, errors, **kwargs):
+        super().__init__(**kwargs)
+        self.errors = {tag: list(tag_errors) for tag, tag_errors in errors.items()}
+        self.calls = []
+        self._operations["tagged"] = self._execute_tagged
+
+    async def _execute_tagged(self, client, tag):
+        self.calls.append((tag, self._clients.index(client)))
+        if self.errors[tag]:
+            raise self.errors[tag].pop(0)
+        return tag
+
+
+class TestAsyncRetry:
+    """Test cases for the async retry loop."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_switches_key_without_blocking(self, monkeypatch):
+        """Test that a rate-limited call is retried on the next key."""
+        monkeypatch.setattr(
+            google_genai_base_service.time,
+            "sleep",
+            lambda seconds: pytest.fail("blocking sleep in async retry"),
+        )
+        service = _EchoService(
+            [Exception("429 Too Many Requests")], api_keys=["key-0", "key-1"]
+        )
+
+        result = await service._execute_with_retry_and_token_switching("echo", "ok")
+
+        assert result == "ok"
+        assert service.used_keys == [0, 1]
+        assert service._key_cooldown[0] > time.monotonic()
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_keys_are_tried_once_per_call(self, monkeypatch):
+        """Test that a call gives up after one round of rate-limited keys."""
+
+        async def fake_sleep(seconds):
+            pass
+
+        monkeypatch.setattr(google_genai_base_service.asyncio, "sleep", fake_sleep)
+        service = _EchoService(
+            [Exception("429 Too Many Requests")] * 10, api_keys=["key-0", "key-1"]
+        )
+
+        with pytest.raises(RuntimeError, match="after trying all 2"):
+            await service._execute_with_retry_and_token_switching("echo", "ok")
+
+        assert service.used_keys == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, monkeypatch):
+        """Test that persistent errors raise once all retries are used."""
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(google_genai_base_service.asyncio, "sleep", fake_sleep)
+        service = _EchoService(
+            [Exception("boom")] * 3, api_keys="key-0", max_retries=2
+        )
+
+        with pytest.raises(RuntimeError):
+            await service._execute_with_retry_and_token_switching("echo", "ok")
+
+        assert len(sleeps) == 2
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self, monkeypatch):
+        """Test that repeated failures open the circuit and skip further calls."""
+
+        async def fake_sleep(seconds):
+            pass
+
+        monkeypatch.setattr(google_genai_base_service.asyncio, "sleep", fake_sleep)
+        service = _EchoService(
+            [Exception("503 unavailable")] * 10, api_keys=["key-0", "key-1"]
+        )
+
+        with pytest.raises(RuntimeError, match="Circuit open"):
+            await service._execute_with_retry_and_token_switching("echo", "ok")
+        assert service.used_keys == [0] * 5 + [1] * 5
+
+        with pytest.raises(RuntimeError, match="Circuit open"):
+            await service._execute_with_retry_and_token_switching("echo", "ok")
+        assert len(service.used_keys) == 10
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_retries", [0, 7])
+    async def test_client_errors_are_not_retried_on_same_key(self, max_retries):
+        """Test that a rejected request moves on to the next key and gives up."""
+        errors = [ClientError(400, {"error": {"message": "bad request"}})] * 10
+        service = _EchoService(
+            errors, api_keys=["key-0", "key-1"], max_retries=max_retries
+        )
+
+        with pytest.raises(RuntimeError, match="after trying all 2"):
+            await service._execute_with_retry_and_token_switching("echo", "ok")
+
+        assert service.used_keys == [0, 1]
+        assert all(breaker.state == "closed" for breaker in service._breakers)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_retry_on_their_own_key(self, monkeypatch):
+        """Test that another call's key switch doesn't move in-flight retries."""
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(seconds):
+            # Let the other call run, including its key switch
+            for _ in range(5):
+                await real_sleep(0)
+
+        monkeypatch.setattr(google_genai_base_service.asyncio, "sleep", fake_sleep)
+        service = _TaggedService(
+            {
+                "A": [Exception("500 internal error")],
+                "B": [Exception("429 Too Many Requests")],
+            },
+            api_keys=["key-0", "key-1", "key-2"],
+        )
+        record_success = [
+            MagicMock(wraps=breaker.record_success) for breaker in service._breakers
+        ]
+        for breaker, wrapped in zip(service._breakers, record_success):
+            breaker.record_success = wrapped
+
+        results = await asyncio.gather(
+            service._execute_with_retry_and_token_switching("tagged", "A"),
+            service._execute_with_retry_and_token_switching("tagged", "B"),
+        )
+
+        assert results == ["A", "B"]
+        assert service.calls == [("A", 0), ("B", 0), ("B", 1), ("A", 0)]
+        assert service._token_index == 1
+        # B's rate limit on key 0 and A's retry on key 0 are both charged there
+        assert record_success[0].call_count == 2
+        assert record_success[1].call_count == 1
+        assert service._breakers[0]._failures == 0
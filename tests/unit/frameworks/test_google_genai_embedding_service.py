@@ -0,0 +1,168 @@
+"""Unit tests for the Google GenAI embedding service."""
+
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from multimodal_rag.frameworks.google_genai_embedding_service import (
+    MAX_BATCH_CHARS,
+    MAX_BATCH_SIZE,
+    GoogleGenAIEmbeddingService,
+)
+
+
+def _fake_embed_content(model, contents, config):
+    """Return one embedding per input whose first value is the text length."""
+    texts = [contents] if isinstance(contents, str) else list(contents)
+    return SimpleNamespace(
+        embeddings=[SimpleNamespace(values=[float(len(text)), 0.5]) for text in texts]
+    )
+
+
+class TestGoogleGenAIEmbeddingService:
+    """Test cases for the Google GenAI embedding service."""
+
+    @pytest.fixture
+    def make_service(self, tmp_path):
+        """Build services with a mocked GenAI client."""
+
+        def _make(cache=True, memory_cache_size=0):
+            service = GoogleGenAIEmbeddingService(
+                api_keys="test-key",
+                embedding_dimensions=2,
+                cache_path=str(tmp_path / "embeddings.sqlite3") if cache else None,
+                memory_cache_size=memory_cache_size,
+            )
+            service._clients[0] = MagicMock()
+            service._clients[0].aio.models.embed_content = AsyncMock(
+                side_effect=_fake_embed_content
+            )
+            return service
+
+        return _make
+
+    @pytest.mark.asyncio
+    async def test_embed_content_without_cache(self, make_service):
+        """Test that every call reaches the API when caching is disabled."""
+        service = make_service(cache=False)
+
+        first = await service.embed_content(["a", "bb"])
+        second = await service.embed_content(["a", "bb"])
+
+        assert [list(e) for e in first] == [[1.0, 0.5], [2.0, 0.5]]
+        assert [list(e) for e in second] == [[1.0, 0.5], [2.0, 0.5]]
+        assert service._clients[0].aio.models.embed_content.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_embed_content_splits_large_inputs_into_batches(self, make_service):
+        """Test that inputs above the API batch limit are sent in several requests."""
+        service = make_service(cache=False)
+        texts = [f"text {i}" for i in range(MAX_BATCH_SIZE * 2 + 5)]
+
+        result = await service.embed_content(texts)
+
+        assert [e[0] for e in result] == [float(len(text)) for text in texts]
+        # Batches are sent concurrently, so their request order is not fixed
+        calls = service._clients[0].aio.models.embed_content.call_args_list
+        assert sorted(
+            (len(call.kwargs["contents"]) for call in calls), reverse=True
+        ) == [
+            MAX_BATCH_SIZE,
+            MAX_BATCH_SIZE,
+            5,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_embed_content_splits_long_texts_by_size(self, make_service):
+        """Test that batches are also limited by their total text length."""
+        service = make_service(cache=False)
+        size = MAX_BATCH_CHARS // 2
+        texts = [str(i) * size for i in range(3)]
+
+        result = await service.embed_content(texts)
+
+        assert [e[0] for e in result] == [float(size)] * 3
+        # Two texts fit in one request, the third needs another
+        assert service._clients[0].aio.models.embed_content.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_embed_content_empty_input(self, make_service):
+        """Test that an empty input returns an empty array without an API call."""
+        service = make_service()
+
+        result = await service.embed_content([])
+
+        assert result.shape == (0, 2)
+        service._clients[0].aio.models.embed_content.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_embed_content_sends_repeated_texts_once(self, make_service):
+        """Test that duplicate texts in one call are embedded once."""
+        service = make_service(cache=False)
+
+        result = await service.embed_content(["a", "bb", "a", "ccc", "bb"])
+
+        assert [e[0] for e in result] == [1.0, 2.0, 1.0, 3.0, 2.0]
+        service._clients[0].aio.models.embed_content.assert_called_once()
+        call = service._clients[0].aio.models.embed_content.call_args
+        assert call.kwargs["contents"] == ["a", "bb", "ccc"]
+
+    @pytest.mark.asyncio
+    async def test_embed_content_only_sends_cache_misses(self, make_service):
+        """Test that cached texts are not embedded again."""
+        service = make_service()
+
+        await service.embed_content(["a", "bb"])
+        result = await service.embed_content(["bb", "ccc", "a"])
+
+        assert result.dtype == np.float32 and result.shape == (3, 2)
+        assert [list(e) for e in result] == [[2.0, 0.5], [3.0, 0.5], [1.0, 0.5]]
+        calls = service._clients[0].aio.models.embed_content.call_args_list
+        assert len(calls) == 2
+        assert calls[1].kwargs["contents"] == "ccc"
+
+    @pytest.mark.asyncio
+    async def test_cache_persists_across_instances(self, make_service):
+        """Test that embeddings stored by one service are reused by another."""
+        await make_service().embed_content(["a", "bb"])
+        service = make_service()
+
+        result = await service.embed_content(["a", "bb"])
+        single = await service.embed_single("a")
+
+        assert [list(e) for e in result] == [[1.0, 0.5], [2.0, 0.5]]
+        assert list(single) == [1.0, 0.5]
+        service._clients[0].aio.models.embed_content.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_evicts_least_recently_used(self, make_service):
+        """Test the in-process LRU without a persistent cache."""
+        service = make_service(cache=False, memory_cache_size=2)
+
+        await service.embed_content(["a", "bb"])
+        await service.embed_single("a")  # refresh "a"
+        await service.embed_single("ccc")  # evicts "bb"
+        await service.embed_content(["a", "bb"])
+
+        calls = service._clients[0].aio.models.embed_content.call_args_list
+        assert [call.kwargs["contents"] for call in calls] == [
+            ["a", "bb"],
+            "ccc",
+            "bb",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_embed_single_shares_one_request(self, make_service):
+        """Test that identical in-flight requests are sent to the API once."""
+        service = make_service(cache=False)
+
+        results = await asyncio.gather(
+            service.embed_single("same"), service.embed_single("same")
+        )
+
+        assert [list(e) for e in results] == [[4.0, 0.5], [4.0, 0.5]]
+        service._clients[0].aio.models.embed_content.assert_called_once()
+        assert service._in_flight == {}
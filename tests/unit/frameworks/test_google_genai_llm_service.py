@@ -0,0 +1,334 @@
+"""Unit tests for the Google GenAI LLM service."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+from google.genai import types
+from google.genai.models import AsyncModels
+
+from multimodal_rag.frameworks.google_genai_llm_service import GoogleGenAILLMService
+
+
+# Sampling settings whose responses may be cached
+GREEDY = {"temperature": 0}
+
+
+class TestGoogleGenAILLMService:
+    """Test cases for the Google GenAI LLM service."""
+
+    @pytest.fixture
+    def make_service(self, tmp_path):
+        """Build services with a mocked GenAI client."""
+
+        def _make(response_text='{"answer": 42}', **kwargs):
+            service = GoogleGenAILLMService(api_keys="test-key", **kwargs)
+            service._clients[0] = MagicMock()
+            # Autospec rejects arguments the SDK method doesn't accept
+            models = create_autospec(AsyncModels, instance=True)
+            models.generate_content.return_value = SimpleNamespace(
+                text=response_text, candidates=[]
+            )
+            service._clients[0].aio.models = models
+            return service
+
+        return _make
+
+    @pytest.mark.asyncio
+    async def test_generate_content_without_cache(self, make_service):
+        """Test that every call reaches the API when caching is disabled."""
+        service = make_service(response_text="hello")
+
+        assert await service.generate_content("hi") == "hello"
+        assert await service.generate_content("hi") == "hello"
+        assert service._clients[0].aio.models.generate_content.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_response_cache_serves_repeated_prompts(self, make_service):
+        """Test that identical requests are answered from the cache."""
+        service = make_service(response_cache_size=8)
+
+        first = await service.generate_structured_content(
+            "q", {"type": "object"}, temperature=0
+        )
+        first["answer"] = 0  # callers get their own copy
+        second = await service.generate_structured_content(
+            "q", {"type": "object"}, temperature=0
+        )
+        await service.generate_structured_content("q", {"type": "array"}, temperature=0)
+
+        assert second == {"answer": 42}
+        calls = service._clients[0].aio.models.generate_content.call_args_list
+        assert len(calls) == 2
+        assert calls[0].kwargs["config"].temperature == 0
+
+    @pytest.mark.asyncio
+    async def test_sampling_settings_are_sent_in_config(self, make_service):
+        """Test that temperature and seed given directly reach the SDK config."""
+        service = make_service(response_text="hello")
+
+        assert await service.generate_content("hi", temperature=0) == "hello"
+        await service.generate_content(
+            "hi", seed=3, config={"max_output_tokens": 16, "temperature": 0.5}
+        )
+
+        calls = service._clients[0].aio.models.generate_content.call_args_list
+        assert calls[0].kwargs["config"].temperature == 0
+        config = calls[1].kwargs["config"]
+        assert (config.seed, config.max_output_tokens, config.temperature) == (
+            3,
+            16,
+            0.5,
+        )
+
+    @pytest.mark.asyncio
+    async def test_response_cache_persists_across_instances(
+        self, make_service, tmp_path
+    ):
+        """Test that responses stored by one service are reused by another."""
+        path = str(tmp_path / "responses.sqlite3")
+        writer = make_service(response_text="hello", response_cache_path=path)
+        await writer.generate_content("hi", config=GREEDY)
+        service = make_service(response_cache_path=path)
+
+        assert await service.generate_content("hi", config=GREEDY) == "hello"
+        service._clients[0].aio.models.generate_content.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sampled_requests_bypass_caches(self, make_service):
+        """Test that requests without temperature 0 or a seed are never reused."""
+        embedding_service = MagicMock()
+        embedding_service.embed_single = AsyncMock(return_value=[1.0, 0.0])
+        service = make_service(
+            response_cache_size=8,
+            embedding_service=embedding_service,
+            semantic_cache_threshold=0.9,
+        )
+
+        await asyncio.gather(
+            service.generate_structured_content("q"),
+            service.generate_structured_content("q"),
+        )
+        await service.generate_content("q", config=types.GenerateContentConfig())
+        await service.generate_content("q", config={"temperature": 0.7})
+
+        assert service._clients[0].aio.models.generate_content.call_count == 4
+        embedding_service.embed_single.assert_not_called()
+
+        await service.generate_content("q", config={"seed": 1})
+        await service.generate_content("q", config={"seed": 1})
+        assert service._clients[0].aio.models.generate_content.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_serves_similar_prompts(self, make_service):
+        """Test that a paraphrased prompt reuses the earlier response."""
+        vectors = {
+            "summarize this image": [1.0, 0.0, 0.1],
+            "describe the picture": [0.99, 0.0, 0.12],
+            "list the tables": [0.0, 1.0, 0.0],
+        }
+        embedding_service = MagicMock()
+        embedding_service.embed_single = AsyncMock(side_effect=vectors.get)
+        service = make_service(
+            response_text="a cat",
+            embedding_service=embedding_service,
+            semantic_cache_threshold=0.92,
+        )
+
+        await service.generate_content("summarize this image", config=GREEDY)
+        assert (
+            await service.generate_content("describe the picture", config=GREEDY)
+            == "a cat"
+        )
+        await service.generate_content("list the tables", config=GREEDY)
+        await service.generate_content(
+            "describe the picture", model="other-model", config=GREEDY
+        )
+
+        assert service._clients[0].aio.models.generate_content.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_structured_content_uses_json_mode(self, make_service):
+        """Test that the schema is sent in the config instead of the prompt."""
+        service = make_service(max_output_tokens=512)
+        schema = {"type": "object"}
+
+        assert await service.generate_structured_content("q", schema) == {
+            "answer": 42
+        }
+        await service.generate_structured_content("q2", schema)
+
+        calls = service._clients[0].aio.models.generate_content.call_args_list
+        assert calls[0].kwargs["contents"] == "q"
+        config = calls[0].kwargs["config"]
+        assert config.response_mime_type == "application/json"
+        assert config.response_json_schema == schema
+        assert config.max_output_tokens == 512
+        assert calls[1].kwargs["config"] is config
+
+    @pytest.mark.asyncio
+    async def test_structured_content_keeps_caller_config(self, make_service):
+        """Test that a caller's config is combined with the JSON mode settings."""
+        service = make_service(max_output_tokens=512)
+        schema = {"type": "object"}
+
+        await service.generate_structured_content(
+            "q",
+            schema,
+            config=types.GenerateContentConfig(
+                temperature=0, top_k=5, response_mime_type="text/plain"
+            ),
+        )
+
+        config = service._clients[0].aio.models.generate_content.call_args.kwargs[
+            "config"
+        ]
+        assert config.response_mime_type == "application/json"
+        assert config.response_json_schema == schema
+        assert (config.max_output_tokens, config.temperature, config.top_k) == (
+            512,
+            0,
+            5,
+        )
+
+    @pytest.mark.asyncio
+    async def test_schema_mismatch_is_logged(self, make_service, caplog):
+        """Test that a response violating the schema is returned with a warning."""
+        service = make_service(response_text='{"answer": "yes"}')
+        schema = {"type": "object", "required": ["answer", "chunk_ids_used"]}
+
+        result = await service.generate_structured_content("q", schema)
+        await service.generate_structured_content("q2", schema)
+
+        assert result == {"answer": "yes"}
+        assert "'chunk_ids_used' is a required property" in caplog.text
+        assert len(service._schema_validators) == 1
+
+    @pytest.mark.asyncio
+    async def test_long_prompt_keeps_head_and_tail(self, make_service):
+        """Test that prompts over max_input_tokens lose their middle part."""
+        service = make_service(response_text="ok", max_input_tokens=50)
+        prompt = "HEAD" + "x" * 1000 + "TAIL"
+
+        await service.generate_content(prompt)
+        await service.generate_content("short prompt")
+
+        calls = service._clients[0].aio.models.generate_content.call_args_list
+        sent = calls[0].kwargs["contents"]
+        assert len(sent) == 200
+        assert sent.startswith("HEAD") and sent.endswith("TAIL")
+        assert "[truncated about 202 tokens]" in sent
+        assert calls[1].kwargs["contents"] == "short prompt"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_prompts_share_one_call(self, make_service):
+        """Test that identical in-flight requests are coalesced into one call."""
+        service = make_service()
+
+        first, second, other = await asyncio.gather(
+            service.generate_structured_content("q", seed=7),
+            service.generate_structured_content("q", seed=7),
+            service.generate_structured_content("other", seed=7),
+        )
+
+        assert first == second == other == {"answer": 42}
+        assert first is not second
+        assert service._clients[0].aio.models.generate_content.call_count == 2
+        assert not service._in_flight
+
+    @pytest.mark.asyncio
+    async def test_coalesced_failure_reaches_every_waiter(self, make_service):
+        """Test that a failed shared call raises in all waiting callers."""
+        service = make_service(max_retries=0)
+        service._clients[0].aio.models.generate_content.side_effect = ValueError("boom")
+
+        results = await asyncio.gather(
+            service.generate_content("q", config=GREEDY),
+            service.generate_content("q", config=GREEDY),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert service._clients[0].aio.models.generate_content.call_count == 1
+        assert not service._in_flight
+
+    @pytest.mark.asyncio
+    async def test_tool_response_parsing(self, make_service):
+        """Test that text and function calls are read from the response parts."""
+        service = make_service()
+        parts = [
+            types.Part(text="thinking", thought=True),
+            types.Part(text="Let me "),
+            types.Part(text="search."),
+            types.Part(
+                function_call=types.FunctionCall(
+                    name="retrieve", args={"query": "cats"}
+                )
+            ),
+        ]
+        service._clients[0].aio.models.generate_content.return_value = SimpleNamespace(
+            candidates=[SimpleNamespace(content=types.Content(parts=parts))]
+        )
+
+        result = await service.generate_content_with_tools("q", tools=[])
+
+        assert result == {
+            "text": "Let me search.",
+            "function_calls": [{"name": "retrieve", "args": {"query": "cats"}}],
+            "has_function_call": True,
+        }
+
+    @pytest.mark.asyncio
+    async def test_tool_config_is_reused_for_same_definitions(self, make_service):
+        """Test that the tool config is built once per set of tool definitions."""
+        service = make_service()
+        tool = {"name": "retrieve", "parameters": {"type": "object"}}
+        other = {"function": {"name": "other"}}
+
+        await service.generate_content_with_tools("q", tools=[tool])
+        await service.generate_content_with_tools("q", tools=[tool])
+        await service.generate_content_with_tools("q", tools=[other])
+
+        calls = service._clients[0].aio.models.generate_content.call_args_list
+        assert calls[0].kwargs["config"] is calls[1].kwargs["config"]
+        assert calls[2].kwargs["config"] is not calls[0].kwargs["config"]
+        declaration = calls[2].kwargs["config"].tools[0].function_declarations[0]
+        assert declaration.name == "other"
+
+    @pytest.mark.asyncio
+    async def test_tool_config_keeps_sampling_settings(self, make_service):
+        """Test that tools are combined with the caller's config and temperature."""
+        service = make_service()
+        tool = {"name": "retrieve", "parameters": {"type": "object"}}
+
+        await service.generate_content_with_tools(
+            "q", tools=[tool], temperature=0, config={"max_output_tokens": 16}
+        )
+
+        config = service._clients[0].aio.models.generate_content.call_args.kwargs[
+            "config"
+        ]
+        assert config.tools[0].function_declarations[0].name == "retrieve"
+        assert (config.temperature, config.max_output_tokens) == (0, 16)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "response_text, expected",
+        [
+            ('{"answer": "yes"}', {"answer": "yes"}),
+            ('```json\n{"answer": "yes"}\n```', {"answer": "yes"}),
+            ('```\n["a", "b"]\n```', ["a", "b"]),
+            ('Here you go:\n```json\n{"n": 1}\n```\nDone.', {"n": 1}),
+            ("I cannot answer that.", {"text": "I cannot answer that."}),
+            ("", {"text": ""}),
+            ("{not json", {"text": "{not json"}),
+        ],
+    )
+    async def test_structured_response_parsing(
+        self, make_service, response_text, expected
+    ):
+        """Test that plain and fenced JSON is parsed and prose is wrapped."""
+        service = make_service(response_text=response_text)
+
+        assert await service.generate_structured_content("q") == expected
@@ -0,0 +1,44 @@
+"""Unit tests for the per-key rate tracker."""
+
+import pytest
+
+from multimodal_rag.frameworks import rate_tracker
+from multimodal_rag.frameworks.rate_tracker import RateTracker
+
+
+class TestRateTracker:
+    """Test cases for the sliding-window rate tracker."""
+
+    @pytest.mark.asyncio
+    async def test_aacquire_within_limit_does_not_wait(self, monkeypatch):
+        """Test that requests under the limit are recorded without waiting."""
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(rate_tracker.asyncio, "sleep", fake_sleep)
+        tracker = RateTracker(num_keys=2, requests_per_minute=2)
+
+        await tracker.aacquire(0)
+        await tracker.aacquire(0)
+        await tracker.aacquire(1)
+
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_aacquire_waits_without_blocking(self, monkeypatch):
+        """Test that a full window delays the next request on the event loop."""
+        monkeypatch.setattr(
+            rate_tracker.time,
+            "sleep",
+            lambda seconds: pytest.fail("blocking sleep in aacquire"),
+        )
+        tracker = RateTracker(num_keys=1, requests_per_minute=2, window_seconds=0.05)
+
+        await tracker.aacquire(0)
+        await tracker.aacquire(0)
+        start = rate_tracker.time.monotonic()
+        await tracker.aacquire(0)
+
+        assert rate_tracker.time.monotonic() - start >= 0.04
@@ -0,0 +1,29 @@
+"""Unit tests for the LLM response cache."""
+
+import threading
+
+import pytest
+
+from multimodal_rag.frameworks.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test cases for the two-tier response cache."""
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_runs_in_worker_thread(self, tmp_path, record_disk_threads):
+        """Test that SQLite reads and writes happen off the event loop thread."""
+        path = str(tmp_path / "responses.sqlite3")
+        loop_thread = threading.get_ident()
+        threads = record_disk_threads(ResponseCache)
+
+        await ResponseCache(path, memory_size=0).set(b"k", {"answer": 42})
+        cache = ResponseCache(path)
+        first = await cache.get(b"k")
+        first["answer"] = 0
+        second = await cache.get(b"k")
+
+        assert second == {"answer": 42}
+        assert await cache.get(b"missing") is None
+        # The second lookup is served from memory
+        assert len(threads) == 3 and loop_thread not in threads
@@ -0,0 +1,116 @@
+"""Unit tests for the document indexing use case."""
+
+import asyncio
+
+import pytest
+
+from multimodal_rag.usecases import document_indexing
+from multimodal_rag.usecases.document_indexing import DocumentIndexingUseCase
+
+
+class _FakeRepository:
+    """In-memory document repository recording what gets indexed."""
+
+    def __init__(self, existing=(), failing=(), blocking=()):
+        self.existing = set(existing)
+        self.failing = set(failing)
+        self.blocking = set(blocking)
+        self.indexed = []
+        self.lookups = []
+
+    async def get_document(self, document_id, index_name=None):
+        self.lookups.append(document_id)
+        # Give the pipeline a chance to run ahead while the lookup is pending
+        await asyncio.sleep(0.01)
+        return {"name": document_id} if document_id in self.existing else None
+
+    async def index_document(self, document, document_id, index_name=None):
+        if document_id in self.blocking:
+            await asyncio.Event().wait()
+        if document_id in self.failing:
+            raise ConnectionError("index unavailable")
+        self.indexed.append(document_id)
+        return True
+
+    async def bulk_index_texts(self, texts, index_name=None):
+        return len(texts), 0, []
+
+
+@pytest.fixture
+def indexing_directory(tmp_path, monkeypatch):
+    """Directory with one Docling JSON result per document."""
+    for name in ("d", "b", "a", "c"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / f"{name}.json").write_text("{}")
+    (tmp_path / "empty").mkdir()
+
+    prepared = []
+
+    def fake_prepare(json_file, document_id, chunker):
+        prepared.append(document_id)
+        if document_id == "c":
+            raise ValueError("invalid Docling JSON")
+        return document_id, object(), ["text"], [], [], []
+
+    monkeypatch.setattr(document_indexing, "HybridChunker", lambda **kwargs: None)
+    monkeypatch.setattr(
+        DocumentIndexingUseCase, "_prepare_document", staticmethod(fake_prepare)
+    )
+    return tmp_path, prepared
+
+
+class TestBulkIndexFromDirectory:
+    """Test cases for the prepare/index pipeline over a result directory."""
+
+    @pytest.mark.asyncio
+    async def test_indexes_in_order_and_isolates_failures(self, indexing_directory):
+        """Test ordering, skipping of indexed documents and per-file errors."""
+        path, prepared = indexing_directory
+        repository = _FakeRepository(existing={"b"}, failing={"d"})
+        use_case = DocumentIndexingUseCase(repository)
+
+        responses = await use_case.bulk_index_from_directory(
+            str(path), generate_embeddings=False
+        )
+
+        assert repository.lookups == ["a", "b", "c", "d"]
+        assert prepared == ["a", "c", "d"]
+        assert repository.indexed == ["a"]
+        assert [response.total_indexed for response in responses] == [2, 1]
+        assert responses[1].total_failed == 1
+        assert "index unavailable" in responses[1].errors[0]
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_preparing_next_document(self, indexing_directory):
+        """Test that cancelling the run leaves no document being prepared."""
+        path, prepared = indexing_directory
+        repository = _FakeRepository(blocking={"a"})
+        use_case = DocumentIndexingUseCase(repository)
+
+        run = asyncio.create_task(
+            use_case.bulk_index_from_directory(str(path), generate_embeddings=False)
+        )
+        while "b" not in repository.lookups:
+            await asyncio.sleep(0)
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+        await asyncio.sleep(0.05)
+
+        assert prepared == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_same_stem_in_two_directories_is_indexed_once(
+        self, indexing_directory
+    ):
+        """Test that a document id found in two directories is indexed once."""
+        path, prepared = indexing_directory
+        (path / "e").mkdir()
+        (path / "e" / "a.json").write_text("{}")
+        repository = _FakeRepository(failing={"d"})
+        use_case = DocumentIndexingUseCase(repository)
+
+        await use_case.bulk_index_from_directory(str(path), generate_embeddings=False)
+
+        assert prepared == ["a", "b", "c", "d"]
+        assert repository.indexed == ["a", "b"]